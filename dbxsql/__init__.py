@@ -2,13 +2,18 @@
 
 from dbxsql.settings import DatabricksSettings, settings
 from dbxsql.models import (
-    QueryResult, QueryStatus, QueryMetrics, ConnectionInfo,
+    QueryResult, QueryStatus, QueryStatusT, QueryMetrics, ConnectionInfo,
     FileInfo, TableInfo, NexsysRecord, SalesRecord, GenericRecord,
-    MODEL_REGISTRY, get_model_class, register_model, list_available_models
+    MODEL_REGISTRY, get_model_class, register_model, list_available_models, build_records,
+    build_tagged_records, Record, RECORD_TAG_KEY, acquire_generic_record, release_records
 )
 from dbxsql.auth import OAuthManager, TokenProvider
-from dbxsql.connection import ConnectionManager, ConnectionManagerInterface
-from dbxsql.query_handler import QueryHandler, ResultParser, PydanticResultParser
+from dbxsql.connection import (
+    ConnectionManager, ConnectionManagerInterface, ConnectionPool, PooledConnectionManager
+)
+from dbxsql.query_handler import (
+    QueryHandler, QuerySession, ResultParser, PydanticResultParser, MsgspecResultParser, ArrowResultParser
+)
 from dbxsql.exceptions import (
     DatabricksHandlerError, AuthenticationError, ConnectionError,
     QueryExecutionError, SyntaxError, TimeoutError, DataParsingError
@@ -22,12 +27,14 @@ __email__ = "your.email@example.com"
 __all__ = [
     # Main classes
     "QueryHandler",
+    "QuerySession",
     "DatabricksSettings",
     "settings",
 
     # Models
     "QueryResult",
     "QueryStatus",
+    "QueryStatusT",
     "QueryMetrics",
     "ConnectionInfo",
     "FileInfo",
@@ -39,14 +46,24 @@ __all__ = [
     "get_model_class",
     "register_model",
     "list_available_models",
+    "build_records",
+    "build_tagged_records",
+    "Record",
+    "RECORD_TAG_KEY",
+    "acquire_generic_record",
+    "release_records",
 
     # Managers and Interfaces
     "OAuthManager",
     "TokenProvider",
     "ConnectionManager",
     "ConnectionManagerInterface",
+    "ConnectionPool",
+    "PooledConnectionManager",
     "ResultParser",
     "PydanticResultParser",
+    "MsgspecResultParser",
+    "ArrowResultParser",
 
     # Exceptions
     "DatabricksHandlerError",
@@ -1,9 +1,13 @@
 """Database connection management for Databricks."""
 
+from __future__ import annotations
+
 from databricks import sql
-from databricks.sql.client import Connection, Cursor
+import copy
 import logging
-from typing import Optional, Protocol
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, List, Optional, Protocol, Tuple
 from contextlib import contextmanager
 from abc import ABC, abstractmethod
 
@@ -12,6 +16,10 @@ from dbxsql.auth import OAuthManager
 from dbxsql.models import ConnectionInfo
 from dbxsql.exceptions import ConnectionError
 
+if TYPE_CHECKING:
+    # databricks.sql.client pulls in pandas and pyarrow; sql.connect imports it on first use
+    from databricks.sql.client import Connection, Cursor
+
 logger = logging.getLogger(__name__)
 
 
@@ -248,4 +256,233 @@ class ConnectionManager(ConnectionManagerInterface):
 
     def get_connection_info(self) -> ConnectionInfo:
         """Get current connection information."""
-        return self._connection_info.model_copy()
\ No newline at end of file
+        return copy.copy(self._connection_info)
+
+
+class ConnectionPool:
+    """Thread-safe LIFO pool of Databricks connections."""
+
+    def __init__(self, connect: Callable[[], Connection], max_size: int = 5, idle_timeout: float = 300.0):
+        self._connect = connect
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._idle: List[Tuple[Connection, float]] = []
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """Number of open connections, idle or in use."""
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        """Number of connections waiting in the pool."""
+        return len(self._idle)
+
+    def acquire(self, timeout: Optional[float] = None) -> Connection:
+        """
+        Take the most recently released connection, opening a new one while below max_size.
+
+        Raises:
+            ConnectionError: If the pool is closed or no connection frees up within timeout
+        """
+        stale: List[Connection] = []
+        # Wakeups that find nothing free wait only for the time left, not a fresh timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            with self._condition:
+                connection = self._take_idle(stale)
+                while connection is None and self._size >= self._max_size:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise ConnectionError(f"No pooled connection available within {timeout} seconds")
+                    self._condition.wait(remaining)
+                    connection = self._take_idle(stale)
+                if connection is not None:
+                    return connection
+                # Reserve the slot before connecting so other threads cannot overshoot max_size
+                self._size += 1
+        finally:
+            for expired in stale:
+                self._close_quietly(expired)
+
+        try:
+            return self._connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def _take_idle(self, stale: List[Connection]) -> Optional[Connection]:
+        """Pop the freshest idle connection, moving expired ones to stale. Caller holds the lock."""
+        if self._closed:
+            raise ConnectionError("Connection pool is closed")
+
+        now = time.monotonic()
+        while self._idle:
+            connection, released_at = self._idle.pop()
+            if now - released_at < self._idle_timeout:
+                return connection
+            stale.append(connection)
+            self._size -= 1
+        return None
+
+    def release(self, connection: Connection, discard: bool = False) -> None:
+        """Return a connection to the pool, closing it instead if discarded or the pool is closed."""
+        with self._condition:
+            keep = not discard and not self._closed
+            if keep:
+                self._idle.append((connection, time.monotonic()))
+            else:
+                self._size -= 1
+            self._condition.notify()
+
+        if not keep:
+            self._close_quietly(connection)
+
+    def close(self) -> None:
+        """Close idle connections; connections still in use are closed when released."""
+        with self._condition:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+
+        for connection in idle:
+            self._close_quietly(connection)
+
+    @staticmethod
+    def _close_quietly(connection: Connection) -> None:
+        """Close a connection, logging instead of raising on failure."""
+        try:
+            connection.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled connection: {str(e)}")
+
+
+class PooledConnectionManager(ConnectionManager):
+    """Connection manager handing out cursors on pooled connections, safe to share across threads."""
+
+    def __init__(self, settings: DatabricksSettings, auth_manager: Optional[AuthenticationManagerProtocol] = None):
+        super().__init__(settings, auth_manager)
+        self._pool: Optional[ConnectionPool] = None
+        # Serialises opening and closing the pool so concurrent callers cannot each build one
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> Optional[ConnectionPool]:
+        """Get the connection pool, if connected."""
+        return self._pool
+
+    def _open_connection(self) -> Connection:
+        """Open a new Databricks connection for the pool."""
+        return sql.connect(
+            server_hostname=self.settings.server_hostname,
+            http_path=self.settings.http_path,
+            access_token=self.auth_manager.get_access_token()
+        )
+
+    def connect(self) -> bool:
+        """
+        Open the pool and warm it with pool_min_size connections.
+
+        Returns:
+            True if connection successful
+
+        Raises:
+            ConnectionError: If connection fails
+        """
+        with self._lock:
+            if self.is_connected():
+                logger.info("Already connected to Databricks")
+            else:
+                self._open_pool()
+        return True
+
+    def _open_pool(self) -> ConnectionPool:
+        """Create, warm and install a new pool. Caller holds self._lock."""
+        pool = ConnectionPool(
+            self._open_connection,
+            max_size=self.settings.pool_max_size,
+            idle_timeout=self.settings.pool_idle_timeout
+        )
+        warm: List[Connection] = []
+        try:
+            logger.info("Opening Databricks connection pool...")
+            for _ in range(min(self.settings.pool_min_size, self.settings.pool_max_size)):
+                warm.append(pool.acquire(timeout=self.settings.connection_timeout))
+        except Exception as e:
+            # Releasing into the closed pool closes the connections opened so far
+            pool.close()
+            for connection in warm:
+                pool.release(connection)
+            error_msg = f"Failed to connect to Databricks: {str(e)}"
+            logger.error(error_msg)
+            raise ConnectionError(error_msg) from e
+
+        for connection in warm:
+            pool.release(connection)
+        self._pool = pool
+        self._connection_info.mark_connected()
+        logger.info(f"Connection pool ready with {pool.size} connection(s)")
+        return pool
+
+    def _current_pool(self) -> ConnectionPool:
+        """Return the open pool, opening it first if needed."""
+        with self._lock:
+            if self.is_connected():
+                return self._pool
+            logger.info("Connection not available, reconnecting...")
+            return self._open_pool()
+
+    def disconnect(self) -> None:
+        """Close the pool and every idle connection in it."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._connection_info.is_connected = False
+
+        if pool is not None:
+            pool.close()
+            logger.info("Disconnected from Databricks")
+
+    def is_connected(self) -> bool:
+        """Check if the pool is open."""
+        return self._pool is not None and self._connection_info.is_connected
+
+    def get_cursor(self) -> Cursor:
+        """Not supported; pooled cursors are only available through get_connection_context."""
+        raise ConnectionError("PooledConnectionManager hands out cursors only via get_connection_context")
+
+    @contextmanager
+    def get_connection_context(self):
+        """
+        Context manager yielding a cursor on a pooled connection.
+        The cursor is closed and the connection returned to the pool on exit;
+        connections that failed with a connection-related error are discarded.
+        """
+        pool = self._current_pool()
+        connection = pool.acquire(timeout=self.settings.connection_timeout)
+        cursor = None
+        discard = False
+
+        try:
+            cursor = connection.cursor()
+            yield cursor
+
+        except Exception as e:
+            logger.error(f"Error in connection context: {str(e)}")
+            discard = self._is_connection_error(e)
+            raise
+
+        finally:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception as e:
+                    logger.warning(f"Error closing cursor: {str(e)}")
+            pool.release(connection, discard=discard)
+            self._connection_info.update_activity()
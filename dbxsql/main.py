@@ -6,7 +6,7 @@ import argparse
 from pathlib import Path
 
 from dbxsql import (
-    QueryHandler, settings, QueryResult, NexsysRecord, SalesRecord,
+    QueryHandler, settings, QueryResult, QueryStatus, NexsysRecord, SalesRecord,
     GenericRecord, get_model_class, list_available_models, DatabricksHandlerError
 )
 
@@ -44,7 +44,7 @@ class ApplicationRunner:
         """Execute a single example query."""
         try:
             result = self.handler.execute_query(query, model_class)
-            if result.status.value == "success":
+            if result.status == QueryStatus.SUCCESS:
                 print(f"   Success! Rows: {result.row_count}")
                 if result.data and len(result.data) <= 3:
                     for item in result.data:
@@ -68,7 +68,7 @@ class ApplicationRunner:
         try:
             results = self.handler.execute_multiple_queries(queries, [GenericRecord] * 3)
             for i, result in results.items():
-                status = "Success" if result.status.value == "success" else "Failed"
+                status = "Success" if result.status == QueryStatus.SUCCESS else "Failed"
                 print(f"   Query {i + 1}: {status} ({result.row_count} rows)")
                 if result.error_message:
                     print(f"     Error: {result.error_message}")
@@ -182,7 +182,7 @@ class ApplicationRunner:
 
     def _display_query_result(self, result: QueryResult) -> None:
         """Display query result."""
-        if result.status.value == "success":
+        if result.status == QueryStatus.SUCCESS:
             print(f"✓ Success! Rows: {result.row_count}, Time: {result.execution_time_seconds:.3f}s")
 
             if result.data:
@@ -218,11 +218,11 @@ class ApplicationRunner:
         result = self.handler.execute_query_with_retry(query, model_class)
 
         print("\nQuery Result:")
-        print(f"Status: {result.status.value}")
+        print(f"Status: {result.status}")
         print(f"Rows: {result.row_count}")
         print(f"Execution time: {result.execution_time_seconds:.3f}s")
 
-        if result.status.value == "success" and result.data:
+        if result.status == QueryStatus.SUCCESS and result.data:
             print("Data:")
             for row in result.data[:10]:  # Show first 10 rows
                 print(f"  {row}")
@@ -243,7 +243,7 @@ class ApplicationRunner:
         results = self.handler.execute_multiple_queries(queries)
 
         for i, result in results.items():
-            print(f"Query {i + 1}: {result.status.value} ({result.row_count} rows)")
+            print(f"Query {i + 1}: {result.status} ({result.row_count} rows)")
             if result.error_message:
                 print(f"  Error: {result.error_message}")
 
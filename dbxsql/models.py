@@ -1,19 +1,50 @@
 """Pydantic models for Databricks SQL handler."""
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Any, Dict, List, Optional, Union, Generic, TypeVar
-from datetime import datetime
-from enum import Enum
+from pydantic import (
+    BaseModel, BeforeValidator, Field, field_validator, model_validator, ConfigDict, TypeAdapter, Discriminator, Tag
+)
+from typing import Annotated, Any, Dict, Iterable, List, Literal, Optional, Sequence, Union, Generic, TypeVar
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from datetime import datetime, timedelta
+import sys
+import threading
+import time
 
 T = TypeVar('T', bound=BaseModel)
 
 
-class QueryStatus(str, Enum):
-    """Query execution status."""
-    SUCCESS = "success"
-    FAILED = "failed"
-    TIMEOUT = "timeout"
-    SYNTAX_ERROR = "syntax_error"
+def _intern_str(v: Optional[str]) -> Optional[str]:
+    """Intern a low-cardinality string so repeated values share one object."""
+    return sys.intern(v) if type(v) is str else v
+
+
+SUCCESS = "success"
+FAILED = "failed"
+TIMEOUT = "timeout"
+SYNTAX_ERROR = "syntax_error"
+
+QueryStatusT = Literal["success", "failed", "timeout", "syntax_error"]
+
+
+class _QueryStatusMeta(type):
+    """Metaclass giving QueryStatus enum-style membership and iteration."""
+
+    def __contains__(cls, value: object) -> bool:
+        return value in cls._values
+
+    def __iter__(cls):
+        return iter(cls._values)
+
+
+class QueryStatus(metaclass=_QueryStatusMeta):
+    """Query execution status; members are plain strings."""
+    SUCCESS = SUCCESS
+    FAILED = FAILED
+    TIMEOUT = TIMEOUT
+    SYNTAX_ERROR = SYNTAX_ERROR
+
+    _values = (SUCCESS, FAILED, TIMEOUT, SYNTAX_ERROR)
 
 
 class FileInfo(BaseModel):
@@ -48,16 +79,26 @@ class TableInfo(BaseModel):
     is_temporary: bool = False
     table_type: Optional[str] = None
 
+    @field_validator('database', 'table_name', 'table_type')
+    @classmethod
+    def intern_names(cls, v: Optional[str]) -> Optional[str]:
+        """Intern names that repeat across many rows."""
+        return _intern_str(v)
+
 
 class QueryResult(BaseModel, Generic[T]):
     """Generic query result wrapper."""
-    status: QueryStatus
-    data: Optional[List[T]] = None
-    raw_data: Optional[List[Any]] = None
+    status: QueryStatusT
+    # Sequence rather than List so validation keeps the caller's rows instead of copying them
+    data: Optional[Sequence[T]] = None
+    raw_data: Optional[Sequence[Any]] = None
     row_count: int = 0
     execution_time_seconds: Optional[float] = None
+    execution_time_ns: Optional[int] = None
     error_message: Optional[str] = None
     query: Optional[str] = None
+    # pyarrow.Table filled by Arrow fetches instead of data/raw_data
+    arrow_table: Optional[Any] = None
 
     @field_validator('row_count')
     @classmethod
@@ -65,53 +106,161 @@ class QueryResult(BaseModel, Generic[T]):
         """Ensure row count is not negative."""
         return max(0, v)
 
+    @classmethod
+    def from_json(cls, payload: Union[str, bytes]) -> 'QueryResult':
+        """Parse a JSON-encoded result; rows stay plain dicts unless the class is parameterised."""
+        if cls is QueryResult:
+            return _query_result_dict_adapter().validate_json(payload)
+        return cls.model_validate_json(payload)
+
+
+@lru_cache(maxsize=None)
+def _query_result_dict_adapter() -> TypeAdapter:
+    """Get the QueryResult[dict] TypeAdapter, built on first use rather than at import."""
+    return TypeAdapter(QueryResult[dict])
 
-class QueryMetrics(BaseModel):
-    """Query execution metrics."""
+
+class _MetricsLockSlot:
+    """Holds the QueryMetrics lock in a slot outside the dataclass fields."""
+    __slots__ = ('_lock',)
+
+
+@dataclass(slots=True)
+class QueryMetrics(_MetricsLockSlot):
+    """Query execution metrics; updates and copies are thread-safe."""
     total_queries: int = 0
     successful_queries: int = 0
     failed_queries: int = 0
     total_execution_time: float = 0.0
     average_execution_time: Optional[float] = None
 
-    def add_query_result(self, result: QueryResult) -> None:
-        """Add a query result to metrics."""
-        self.total_queries += 1
-        if result.status == QueryStatus.SUCCESS:
-            self.successful_queries += 1
-        else:
-            self.failed_queries += 1
+    def __post_init__(self) -> None:
+        # Every instance, including replace() copies, gets its own lock
+        self._lock = threading.Lock()
 
-        if result.execution_time_seconds:
-            self.total_execution_time += result.execution_time_seconds
-            self.average_execution_time = self.total_execution_time / self.total_queries
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle and deepcopy the counters without the lock."""
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self)}
 
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._lock = threading.Lock()
 
-class ConnectionInfo(BaseModel):
-    """Database connection information."""
+    def add_query_result(self, result: QueryResult) -> None:
+        """Add a query result to metrics."""
+        succeeded = result.status == QueryStatus.SUCCESS
+        # Running mean; queries without a recorded time count as zero seconds
+        execution_time = result.execution_time_seconds or 0.0
+
+        with self._lock:
+            self.total_queries += 1
+            if succeeded:
+                self.successful_queries += 1
+            else:
+                self.failed_queries += 1
+
+            self.total_execution_time += execution_time
+            previous_average = self.average_execution_time or 0.0
+            self.average_execution_time = previous_average + (execution_time - previous_average) / self.total_queries
+
+    def reset(self) -> None:
+        """Zero every counter in place so existing references stay valid."""
+        with self._lock:
+            self.total_queries = 0
+            self.successful_queries = 0
+            self.failed_queries = 0
+            self.total_execution_time = 0.0
+            self.average_execution_time = None
+
+    def copy(self) -> 'QueryMetrics':
+        """Return a consistent snapshot of the metrics."""
+        with self._lock:
+            return replace(self)
+
+
+@dataclass(slots=True, init=False)
+class ConnectionInfo:
+    """Database connection information.
+
+    Activity is tracked as a monotonic clock reading; ``last_activity`` is
+    only materialised as a datetime when it is read.
+    """
     server_hostname: str
     http_path: str
     is_connected: bool = False
     connection_time: Optional[datetime] = None
-    last_activity: Optional[datetime] = None
+    # Not init fields, so dataclasses.replace() only passes the public ones to __init__
+    _activity_epoch: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    _activity_epoch_ns: int = field(default=0, init=False, repr=False, compare=False)
+    _activity_ns: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    def __init__(self, server_hostname: str, http_path: str, is_connected: bool = False,
+                 connection_time: Optional[datetime] = None, last_activity: Optional[datetime] = None):
+        self.server_hostname = server_hostname
+        self.http_path = http_path
+        self.is_connected = is_connected
+        self.connection_time = connection_time
+        self.last_activity = last_activity
+
+    @property
+    def last_activity(self) -> Optional[datetime]:
+        """Timestamp of the last recorded activity."""
+        if self._activity_ns is None:
+            return None
+        elapsed_us = (self._activity_ns - self._activity_epoch_ns) // 1000
+        return self._activity_epoch + timedelta(microseconds=elapsed_us)
+
+    @last_activity.setter
+    def last_activity(self, value: Optional[datetime]) -> None:
+        """Anchor activity tracking to a wall-clock timestamp."""
+        self._activity_epoch = value
+        self._activity_epoch_ns = time.monotonic_ns()
+        self._activity_ns = self._activity_epoch_ns if value is not None else None
 
     def mark_connected(self) -> None:
         """Mark connection as established."""
+        now = datetime.now()
         self.is_connected = True
-        self.connection_time = datetime.now()
-        self.last_activity = datetime.now()
+        self.connection_time = now
+        self.last_activity = now
 
     def update_activity(self) -> None:
         """Update last activity timestamp."""
-        self.last_activity = datetime.now()
+        if self._activity_epoch is None:
+            self.last_activity = datetime.now()
+        else:
+            self._activity_ns = time.monotonic_ns()
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Return the public fields and last_activity as a dict, like the former Pydantic model."""
+        return {
+            'server_hostname': self.server_hostname,
+            'http_path': self.http_path,
+            'is_connected': self.is_connected,
+            'connection_time': self.connection_time,
+            'last_activity': self.last_activity,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the public fields and last_activity rather than the raw clock readings."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.server_hostname, self.http_path, self.is_connected, self.connection_time, self.last_activity) ==
+                (other.server_hostname, other.http_path, other.is_connected, other.connection_time, other.last_activity))
+
+    def __repr__(self) -> str:
+        """Show last_activity as a timestamp rather than the raw clock fields."""
+        return (f"ConnectionInfo(server_hostname={self.server_hostname!r}, http_path={self.http_path!r}, "
+                f"is_connected={self.is_connected!r}, connection_time={self.connection_time!r}, "
+                f"last_activity={self.last_activity!r})")
 
 
 # Example domain-specific models
 class NexsysRecord(BaseModel):
     """Example model for NEXSYS data records."""
     model_config = ConfigDict(
-        # Allow extra fields that might be in the data
-        extra="allow",
         # Parse datetime strings automatically
         json_encoders={
             datetime: lambda v: v.isoformat() if v else None
@@ -123,6 +272,84 @@ class NexsysRecord(BaseModel):
     created_date: Optional[datetime] = None
     status: Optional[str] = None
     amount: Optional[float] = None
+    # Columns in the data that are not declared above
+    extras: Dict[str, Any] = Field(default_factory=dict)
+
+    @model_validator(mode='before')
+    @classmethod
+    def collect_extras(cls, data: Any) -> Any:
+        """Move undeclared columns into extras."""
+        fields = cls.model_fields
+        if isinstance(data, dict) and not data.keys() <= fields.keys():
+            extras = dict(data.get('extras') or {})
+            declared = {}
+            for key, value in data.items():
+                if key in fields:
+                    declared[key] = value
+                else:
+                    extras[key] = value
+            declared['extras'] = extras
+            return declared
+        return data
+
+    @field_validator('status')
+    @classmethod
+    def intern_status(cls, v: Optional[str]) -> Optional[str]:
+        """Intern status values that repeat across many rows."""
+        return _intern_str(v)
+
+    def __getattr__(self, name: str) -> Any:
+        """Fall back to extras so undeclared columns stay readable as attributes."""
+        extras = self.__dict__.get('extras')
+        if extras is not None and name in extras:
+            return extras[name]
+        return super().__getattr__(name)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'NexsysRecord':
+        """Build a record from already-typed cursor values without running validation."""
+        defaults = _trusted_defaults(cls)
+        if defaults is None:
+            return cls.model_validate(data)
+        values = {**defaults, **data}
+        fields_set = set(data)
+        # Merge a passed extras dict with the undeclared columns, as collect_extras does
+        extras = dict(values.pop('extras', None) or {})
+        undeclared = values.keys() - defaults.keys()
+        if undeclared:
+            extras.update({key: values.pop(key) for key in undeclared})
+            fields_set -= undeclared
+            fields_set.add('extras')
+        values['extras'] = extras
+        values['status'] = _intern_str(values['status'])
+        record = object.__new__(cls)
+        object.__setattr__(record, '__dict__', values)
+        object.__setattr__(record, '__pydantic_fields_set__', fields_set)
+        object.__setattr__(record, '__pydantic_extra__', None)
+        object.__setattr__(record, '__pydantic_private__', None)
+        return record
+
+
+@lru_cache(maxsize=None)
+def _trusted_defaults(model_class: type) -> Optional[Dict[str, Any]]:
+    """Column defaults from_trusted fills in for a NexsysRecord class.
+
+    Returns None when a field has no plain default or the class adds validation
+    that from_trusted would skip, so the caller validates instead.
+    """
+    decorators = model_class.__pydantic_decorators__
+    base_decorators = NexsysRecord.__pydantic_decorators__
+    if (decorators.field_validators.keys() != base_decorators.field_validators.keys() or
+            decorators.model_validators.keys() != base_decorators.model_validators.keys()):
+        return None
+    defaults = {}
+    for name, info in model_class.model_fields.items():
+        if name == 'extras':
+            continue
+        if info.is_required() or info.default_factory is not None or info.metadata:
+            return None
+        defaults[name] = info.default
+    return defaults
 
 
 class SalesRecord(BaseModel):
@@ -135,17 +362,18 @@ class SalesRecord(BaseModel):
     total_amount: Optional[float] = None
     transaction_date: datetime
 
-    @field_validator('total_amount', mode='before')
+    @property
+    def total(self) -> float:
+        """Total amount, calculated from quantity and unit price if not provided."""
+        if self.total_amount is not None:
+            return self.total_amount
+        return self.quantity * self.unit_price
+
+    @field_validator('customer_id', 'product_id')
     @classmethod
-    def calculate_total(cls, v: Optional[float], info) -> Optional[float]:
-        """Calculate total amount if not provided."""
-        if v is None:
-            data = info.data
-            quantity = data.get('quantity')
-            unit_price = data.get('unit_price')
-            if quantity is not None and unit_price is not None:
-                return quantity * unit_price
-        return v
+    def intern_ids(cls, v: Optional[str]) -> Optional[str]:
+        """Intern identifiers that repeat across many rows."""
+        return _intern_str(v)
 
 
 class GenericRecord(BaseModel):
@@ -177,6 +405,88 @@ class GenericRecord(BaseModel):
         return self.data.items()
 
 
+# Released GenericRecord instances kept for reuse, plus their ids so a record is never pooled twice
+_GENERIC_RECORD_POOL_SIZE = 4096
+_GENERIC_RECORD_POOL: List[GenericRecord] = []
+_POOLED_RECORD_IDS: set = set()
+_GENERIC_RECORD_POOL_LOCK = threading.Lock()
+
+
+def acquire_generic_record(data: Dict[str, Any]) -> GenericRecord:
+    """Return a GenericRecord wrapping data, reusing a released instance when one is pooled."""
+    with _GENERIC_RECORD_POOL_LOCK:
+        if not _GENERIC_RECORD_POOL:
+            record = None
+        else:
+            record = _GENERIC_RECORD_POOL.pop()
+            _POOLED_RECORD_IDS.discard(id(record))
+    if record is None:
+        return GenericRecord(data=data)
+    record.__dict__['data'] = data
+    return record
+
+
+def release_records(records: Iterable[Any]) -> None:
+    """Hand GenericRecord instances back to the pool; they must not be used afterwards."""
+    with _GENERIC_RECORD_POOL_LOCK:
+        for record in records:
+            if len(_GENERIC_RECORD_POOL) >= _GENERIC_RECORD_POOL_SIZE:
+                break
+            # Skip records released twice so two later rows never share an instance
+            if type(record) is GenericRecord and id(record) not in _POOLED_RECORD_IDS:
+                _GENERIC_RECORD_POOL.append(record)
+                _POOLED_RECORD_IDS.add(id(record))
+
+
+# Key naming the record model of each row in a mixed batch
+RECORD_TAG_KEY = "record_type"
+
+_RECORD_TAGS: Dict[type, str] = {
+    NexsysRecord: 'nexsys',
+    SalesRecord: 'sales',
+    GenericRecord: 'generic',
+}
+
+
+def _record_tag(value: Any) -> str:
+    """Read the record tag from a row dictionary or derive it from a model instance."""
+    if isinstance(value, dict):
+        return value.get(RECORD_TAG_KEY, 'generic')
+    return _RECORD_TAGS.get(type(value), 'generic')
+
+
+def _strip_record_tag(value: Any) -> Any:
+    """Drop RECORD_TAG_KEY from a row dictionary so it does not reach the model's fields."""
+    if isinstance(value, dict) and RECORD_TAG_KEY in value:
+        return {key: item for key, item in value.items() if key != RECORD_TAG_KEY}
+    return value
+
+
+def _generic_row(value: Any) -> Any:
+    """Wrap a flat row as GenericRecord data; rows already shaped as {"data": {...}} pass through."""
+    value = _strip_record_tag(value)
+    if isinstance(value, dict) and not (value.keys() == {'data'} and isinstance(value['data'], dict)):
+        return {'data': value}
+    return value
+
+
+# Tagged union of the built-in record models, dispatched on RECORD_TAG_KEY
+Record = Annotated[
+    Union[
+        Annotated[NexsysRecord, BeforeValidator(_strip_record_tag), Tag('nexsys')],
+        Annotated[SalesRecord, BeforeValidator(_strip_record_tag), Tag('sales')],
+        Annotated[GenericRecord, BeforeValidator(_generic_row), Tag('generic')],
+    ],
+    Discriminator(_record_tag),
+]
+
+
+@lru_cache(maxsize=None)
+def _tagged_records_adapter() -> TypeAdapter:
+    """Get the TypeAdapter for a list of tagged records, built on first use rather than at import."""
+    return TypeAdapter(List[Record])
+
+
 # Model registry for dynamic model selection
 MODEL_REGISTRY: Dict[str, type[BaseModel]] = {
     'nexsys': NexsysRecord,
@@ -186,17 +496,44 @@ MODEL_REGISTRY: Dict[str, type[BaseModel]] = {
     'generic': GenericRecord,
 }
 
+# Frozen view of the registered names, rebuilt by register_model
+_REGISTRY_KEYS: frozenset[str] = frozenset(MODEL_REGISTRY)
+
+# Set once register_model has mutated MODEL_REGISTRY
+_registry_dirty = False
 
+
+@lru_cache(maxsize=64)
 def get_model_class(model_name: str) -> type[BaseModel]:
-    """Get model class by name."""
+    """Get model class by name. Lookups are cached; add models via register_model."""
     return MODEL_REGISTRY.get(model_name.lower(), GenericRecord)
 
 
 def register_model(name: str, model_class: type[BaseModel]) -> None:
     """Register a new model class."""
+    global _REGISTRY_KEYS, _registry_dirty
     MODEL_REGISTRY[name.lower()] = model_class
+    _REGISTRY_KEYS = frozenset(MODEL_REGISTRY)
+    get_model_class.cache_clear()
+    _registry_dirty = True
 
 
 def list_available_models() -> List[str]:
-    """List all available model names."""
-    return list(MODEL_REGISTRY.keys())
\ No newline at end of file
+    """List all available model names in sorted order."""
+    return sorted(_REGISTRY_KEYS)
+
+
+@lru_cache(maxsize=None)
+def _records_adapter(model_class: type[BaseModel]) -> TypeAdapter:
+    """Get the list TypeAdapter for a model class, built once per class."""
+    return TypeAdapter(List[model_class])
+
+
+def build_records(rows: List[Dict[str, Any]], model_class: type[BaseModel]) -> List[BaseModel]:
+    """Validate a batch of row dictionaries into model instances in a single call."""
+    return _records_adapter(model_class).validate_python(rows)
+
+
+def build_tagged_records(rows: List[Dict[str, Any]]) -> List[BaseModel]:
+    """Validate a mixed batch of rows, picking each row's model from its RECORD_TAG_KEY."""
+    return _tagged_records_adapter().validate_python(rows)
@@ -1,28 +1,114 @@
 """Query execution and result parsing with Pydantic models."""
 
+from __future__ import annotations
+
 from databricks import sql
-from databricks.sql.client import Cursor
 import logging
+import random
+import re
+import sys
 import time
-from typing import Any, Dict, List, Optional, Type, TypeVar, Protocol
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Type, TypeVar, Protocol
 from pydantic import BaseModel, ValidationError
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from itertools import repeat
 
 from dbxsql.settings import DatabricksSettings
-from dbxsql.connection import ConnectionManager, ConnectionManagerInterface
+from dbxsql.connection import ConnectionManager, ConnectionManagerInterface, PooledConnectionManager
 from dbxsql.models import (
     QueryResult, QueryStatus, QueryMetrics, FileInfo, TableInfo,
-    GenericRecord, get_model_class
+    GenericRecord, get_model_class, build_records, acquire_generic_record
 )
 from dbxsql.exceptions import (
     QueryExecutionError, SyntaxError, TimeoutError, DataParsingError
 )
 
+if TYPE_CHECKING:
+    from databricks.sql.client import Cursor
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=BaseModel)
 
 
+# Error classification rules, first match wins: (pattern, status, message prefix, exception class)
+_SERVER_ERROR_RULES = (
+    (re.compile(r"PARSE_SYNTAX_ERROR"), QueryStatus.SYNTAX_ERROR, "SQL syntax error", SyntaxError),
+)
+_GENERIC_ERROR_RULES = (
+    (re.compile(r"timeout", re.IGNORECASE), QueryStatus.TIMEOUT, "Query timeout", TimeoutError),
+)
+
+
+def _match_error_rule(rules: tuple, error_msg: str) -> Optional[tuple]:
+    """Return the first rule whose pattern matches the error message, or None."""
+    for rule in rules:
+        if rule[0].search(error_msg):
+            return rule
+    return None
+
+
+@lru_cache(maxsize=64)
+def _synthetic_column_names(width: int) -> tuple:
+    """Interned positional column names used when the cursor gives no usable description."""
+    return tuple(sys.intern(f"column_{j}") for j in range(width))
+
+
+def _column_names(cursor: Cursor) -> List[str]:
+    """Extract column names from cursor description."""
+    if cursor.description:
+        return [desc[0] for desc in cursor.description]
+    return []
+
+
+def _row_to_dict(row: Any, column_names: List[str]) -> Dict[str, Any]:
+    """Convert a row to dictionary using column names."""
+    if column_names and len(column_names) == len(row):
+        return dict(zip(column_names, row))
+    # Fallback: use generic column names
+    return dict(zip(_synthetic_column_names(len(row)), row))
+
+
+def _rows_to_dicts(column_names: List[str], rows: List[Any]) -> Optional[List[Dict[str, Any]]]:
+    """Zip every row with the column names, or return None if any row width differs."""
+    if not column_names or set(map(len, rows)) != {len(column_names)}:
+        return None
+    return list(map(dict, map(zip, repeat(column_names), rows)))
+
+
+def _import_msgspec():
+    """Import msgspec on first use so it stays an optional dependency."""
+    try:
+        import msgspec
+    except ImportError as e:
+        raise ImportError("The msgspec parser backend requires msgspec: pip install dbxsql[msgspec]") from e
+    return msgspec
+
+
+def _is_struct_class(model_class: Any) -> bool:
+    """Check for a msgspec.Struct subclass without importing msgspec."""
+    msgspec = sys.modules.get("msgspec")
+    return msgspec is not None and isinstance(model_class, type) and issubclass(model_class, msgspec.Struct)
+
+
+@lru_cache(maxsize=None)
+def struct_for_model(model_class: Type[BaseModel]) -> type:
+    """Build a msgspec.Struct type with the same fields and defaults as a Pydantic model."""
+    msgspec = _import_msgspec()
+    fields = []
+    for name, info in model_class.model_fields.items():
+        if info.is_required():
+            fields.append((name, info.annotation))
+        elif info.default_factory is not None:
+            fields.append((name, info.annotation, msgspec.field(default_factory=info.default_factory)))
+        else:
+            fields.append((name, info.annotation, info.default))
+    return msgspec.defstruct(model_class.__name__, fields, kw_only=True)
+
+
 class ResultParser(ABC):
     """Abstract base class for result parsers."""
 
@@ -35,8 +121,9 @@ class ResultParser(ABC):
 class PydanticResultParser(ResultParser):
     """Parser for converting raw results to Pydantic models."""
 
-    def __init__(self, model_class: Type[T]):
+    def __init__(self, model_class: Type[T], use_record_pool: bool = False):
         self.model_class = model_class
+        self.use_record_pool = use_record_pool
 
     def parse_results(self, raw_data: List[Any], cursor: Cursor) -> List[T]:
         """Parse raw query results into Pydantic models."""
@@ -45,6 +132,21 @@ class PydanticResultParser(ResultParser):
 
         try:
             column_names = self._get_column_names(cursor)
+
+            if self.model_class != GenericRecord:
+                # Fast path: validate all rows in one call, fall back to per-row parsing on failure
+                try:
+                    row_dicts = _rows_to_dicts(column_names, raw_data)
+                    if row_dicts is None:
+                        row_dicts = [self._row_to_dict(row, column_names) for row in raw_data]
+                    if 'from_trusted' in vars(self.model_class):
+                        # Cursor values are already typed server-side; skip validation entirely.
+                        # Subclasses only get this path by defining from_trusted themselves.
+                        return [self.model_class.from_trusted(row_dict) for row_dict in row_dicts]
+                    return build_records(row_dicts, self.model_class)
+                except Exception as e:
+                    logger.debug(f"Batch parsing failed, parsing rows individually: {str(e)}")
+
             parsed_results = []
             parsing_errors = []
 
@@ -80,24 +182,59 @@ class PydanticResultParser(ResultParser):
 
     def _get_column_names(self, cursor: Cursor) -> List[str]:
         """Extract column names from cursor description."""
-        if cursor.description:
-            return [desc[0] for desc in cursor.description]
-        return []
+        return _column_names(cursor)
 
     def _row_to_dict(self, row: Any, column_names: List[str]) -> Dict[str, Any]:
         """Convert a row to dictionary using column names."""
-        if column_names and len(column_names) == len(row):
-            return dict(zip(column_names, row))
-        else:
-            # Fallback: use generic column names
-            return {f"column_{j}": value for j, value in enumerate(row)}
+        return _row_to_dict(row, column_names)
 
     def _parse_single_row(self, row_dict: Dict[str, Any]) -> T:
         """Parse a single row dictionary into the target model."""
         if self.model_class == GenericRecord:
+            if self.use_record_pool:
+                return acquire_generic_record(row_dict)
             return GenericRecord(data=row_dict)
         else:
-            return self.model_class(**row_dict)
+            # Validate the row mapping directly instead of re-packing it as kwargs;
+            # model_construct is slower than this under pydantic-core and skips validators
+            return self.model_class.model_validate(row_dict)
+
+
+class MsgspecResultParser(ResultParser):
+    """Parser converting raw results to msgspec.Struct instances; model validators are not run."""
+
+    def __init__(self, struct_class: type):
+        self._msgspec = _import_msgspec()
+        self.model_class = struct_class
+
+    def parse_results(self, raw_data: List[Any], cursor: Cursor) -> List[Any]:
+        """Convert all rows in a single msgspec.convert call."""
+        if not raw_data:
+            return []
+
+        column_names = _column_names(cursor)
+        row_dicts = _rows_to_dicts(column_names, raw_data)
+        if row_dicts is None:
+            row_dicts = [_row_to_dict(row, column_names) for row in raw_data]
+        try:
+            return self._msgspec.convert(row_dicts, type=List[self.model_class])
+        except self._msgspec.ValidationError as e:
+            error_msg = f"Failed to parse query results: {str(e)}"
+            logger.error(error_msg)
+            raise DataParsingError(error_msg, raw_data, self.model_class) from e
+
+
+class ArrowResultParser(ResultParser):
+    """Parser keeping results as a columnar pyarrow.Table, optionally narrowed to some columns."""
+
+    def __init__(self, columns: Optional[List[str]] = None):
+        self.columns = columns
+
+    def parse_results(self, raw_data: Any, cursor: Cursor) -> Any:
+        """Return the Arrow table fetched by the executor without converting any cells."""
+        if self.columns:
+            return raw_data.select(self.columns)
+        return raw_data
 
 
 class QueryExecutor:
@@ -107,83 +244,149 @@ class QueryExecutor:
         self._connection_manager = connection_manager
         self._settings = settings
 
-    def execute_query(self, query: str, parser: Optional[ResultParser] = None, fetch_all: bool = True) -> QueryResult[T]:
-        """Execute a single SQL query."""
-        start_time = time.time()
-        result = QueryResult[T](status=QueryStatus.FAILED, query=query.strip())
+    def execute_query(self, query: str, parser: Optional[ResultParser] = None, fetch_all: bool = True,
+                      batch_size: Optional[int] = None) -> QueryResult[T]:
+        """Execute a single SQL query; a batch_size fetches and parses rows in batches of that size."""
+        return self._execute_in_context(self._connection_manager.get_connection_context(), query, parser,
+                                        fetch_all, batch_size)
+
+    def _execute_on_cursor(self, cursor: Cursor, query: str, parser: Optional[ResultParser] = None,
+                           fetch_all: bool = True, batch_size: Optional[int] = None) -> QueryResult[T]:
+        """Execute a single SQL query on a cursor the caller keeps open."""
+        return self._execute_in_context(nullcontext(cursor), query, parser, fetch_all, batch_size)
+
+    def _execute_in_context(self, cursor_context: Any, query: str, parser: Optional[ResultParser],
+                            fetch_all: bool, batch_size: Optional[int]) -> QueryResult[T]:
+        """Run the query on the cursor entered from cursor_context and classify any failure."""
+        start_ns = time.perf_counter_ns()
+        # Unparameterised on purpose: subscripting QueryResult[T] per call costs as much as the
+        # construction itself, and model_construct or slots would not make it cheaper
+        result = QueryResult(status=QueryStatus.FAILED, query=query.strip())
 
         try:
-            with self._connection_manager.get_connection_context() as cursor:
+            with cursor_context as cursor:
                 logger.info(f"Executing query: {query[:100]}...")
                 cursor.execute(query)
 
+                # DDL/DML without fetch_all skips every fetch and parse step below
                 if fetch_all:
-                    raw_data = cursor.fetchall()
-                    result.raw_data = raw_data
-                    result.row_count = len(raw_data) if raw_data else 0
-
-                    # Parse data if parser provided
-                    if parser and raw_data:
-                        result.data = parser.parse_results(raw_data, cursor)
+                    if isinstance(parser, ArrowResultParser):
+                        table = parser.parse_results(cursor.fetchall_arrow(), cursor)
+                        result.arrow_table = table
+                        result.row_count = table.num_rows
+
+                    elif batch_size:
+                        raw_data, data = self._fetch_in_batches(cursor, parser, batch_size)
+                        result.raw_data = raw_data
+                        result.row_count = len(raw_data)
+                        if parser and raw_data:
+                            result.data = data
+
+                    else:
+                        raw_data = cursor.fetchall()
+                        result.raw_data = raw_data
+                        result.row_count = len(raw_data) if raw_data else 0
+
+                        # Parse data if parser provided
+                        if parser and raw_data:
+                            result.data = parser.parse_results(raw_data, cursor)
 
                 result.status = QueryStatus.SUCCESS
-                result.execution_time_seconds = time.time() - start_time
+                self._record_elapsed(result, start_ns)
 
                 logger.info(f"Query executed successfully. Rows: {result.row_count}, "
                           f"Time: {result.execution_time_seconds:.2f}s")
 
         except sql.exc.ServerOperationError as e:
-            result = self._handle_server_error(e, result, query, start_time)
+            result = self._handle_server_error(e, result, query, start_ns)
         except sql.exc.Error as e:
-            result = self._handle_database_error(e, result, query, start_time)
+            result = self._handle_database_error(e, result, query, start_ns)
         except Exception as e:
-            result = self._handle_generic_error(e, result, query, start_time)
+            result = self._handle_generic_error(e, result, query, start_ns)
 
         return result
 
-    def _handle_server_error(self, error: sql.exc.ServerOperationError, result: QueryResult, query: str, start_time: float) -> QueryResult:
+    def _fetch_in_batches(self, cursor: Cursor, parser: Optional[ResultParser], batch_size: int) -> tuple:
+        """Fetch rows with fetchmany, parsing each batch before the next one is fetched."""
+        raw_data: List[Any] = []
+        data: List[Any] = []
+
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            raw_data.extend(batch)
+            if parser:
+                data.extend(parser.parse_results(batch, cursor))
+
+        return raw_data, data
+
+    @staticmethod
+    def _record_elapsed(result: QueryResult, start_ns: int) -> None:
+        """Store the monotonic time elapsed since start_ns on the result."""
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        result.execution_time_ns = elapsed_ns
+        result.execution_time_seconds = elapsed_ns / 1e9
+
+    def _handle_server_error(self, error: sql.exc.ServerOperationError, result: QueryResult, query: str, start_ns: int) -> QueryResult:
         """Handle server operation errors."""
-        result.execution_time_seconds = time.time() - start_time
+        self._record_elapsed(result, start_ns)
         error_msg = str(error)
 
-        if "PARSE_SYNTAX_ERROR" in error_msg:
-            result.status = QueryStatus.SYNTAX_ERROR
-            result.error_message = f"SQL syntax error: {error_msg}"
-            logger.error(f"Syntax error in query: {error_msg}")
-            raise SyntaxError(result.error_message, query, error)
-        else:
-            result.error_message = f"Server operation error: {error_msg}"
-            logger.error(result.error_message)
-            raise QueryExecutionError(result.error_message, query, error)
+        rule = _match_error_rule(_SERVER_ERROR_RULES, error_msg)
+        if rule:
+            self._raise_for_rule(rule, error, error_msg, result, query)
+
+        result.error_message = f"Server operation error: {error_msg}"
+        logger.error(result.error_message)
+        raise QueryExecutionError(result.error_message, query, error)
 
-    def _handle_database_error(self, error: sql.exc.Error, result: QueryResult, query: str, start_time: float) -> QueryResult:
+    def _handle_database_error(self, error: sql.exc.Error, result: QueryResult, query: str, start_ns: int) -> QueryResult:
         """Handle database errors."""
-        result.execution_time_seconds = time.time() - start_time
+        self._record_elapsed(result, start_ns)
         result.error_message = f"Database error: {str(error)}"
         logger.error(result.error_message)
         raise QueryExecutionError(result.error_message, query, error)
 
-    def _handle_generic_error(self, error: Exception, result: QueryResult, query: str, start_time: float) -> QueryResult:
+    def _handle_generic_error(self, error: Exception, result: QueryResult, query: str, start_ns: int) -> QueryResult:
         """Handle generic errors."""
-        result.execution_time_seconds = time.time() - start_time
+        self._record_elapsed(result, start_ns)
+        error_msg = str(error)
 
-        if "timeout" in str(error).lower():
-            result.status = QueryStatus.TIMEOUT
-            result.error_message = f"Query timeout: {str(error)}"
-            logger.error(result.error_message)
-            raise TimeoutError(result.error_message)
-        else:
-            result.error_message = f"Unexpected error: {str(error)}"
-            logger.error(result.error_message)
-            raise QueryExecutionError(result.error_message, query, error)
+        rule = _match_error_rule(_GENERIC_ERROR_RULES, error_msg)
+        if rule:
+            self._raise_for_rule(rule, error, error_msg, result, query)
+
+        result.error_message = f"Unexpected error: {error_msg}"
+        logger.error(result.error_message)
+        raise QueryExecutionError(result.error_message, query, error)
+
+    def _raise_for_rule(self, rule: tuple, error: Exception, error_msg: str, result: QueryResult, query: str) -> None:
+        """Record the matched rule's status and message on the result and raise its exception."""
+        _, status, prefix, error_class = rule
+        result.status = status
+        result.error_message = f"{prefix}: {error_msg}"
+        logger.error(result.error_message)
+
+        if issubclass(error_class, QueryExecutionError):
+            raise error_class(result.error_message, query, error)
+        raise error_class(result.error_message)
 
 
 class RetryPolicy:
     """Handles retry logic for query execution."""
 
-    def __init__(self, max_retries: int = 3, base_delay: float = 1.0):
+    # Errors that retrying cannot fix
+    _NON_RETRYABLE: tuple = (SyntaxError,)
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 1.0, jitter: float = 0.0,
+                 non_retryable: tuple = ()):
         self.max_retries = max_retries
         self.base_delay = base_delay
+        self.jitter = jitter
+        self._non_retryable = self._NON_RETRYABLE + tuple(non_retryable)
+        # Exponential backoff schedule, fixed at construction
+        self._delays = tuple(base_delay * (1 << attempt) for attempt in range(max_retries))
 
     def execute_with_retry(self, operation, *args, **kwargs):
         """Execute operation with retry logic."""
@@ -194,14 +397,14 @@ class RetryPolicy:
                 logger.info(f"Attempt {attempt + 1}/{self.max_retries + 1}")
                 return operation(*args, **kwargs)
 
-            except SyntaxError:
-                # Don't retry syntax errors
-                raise
-
             except (QueryExecutionError, TimeoutError) as e:
+                if isinstance(e, self._non_retryable):
+                    raise
                 last_exception = e
                 if attempt < self.max_retries:
-                    wait_time = self.base_delay * (2 ** attempt)  # Exponential backoff
+                    wait_time = self._delays[attempt]
+                    if self.jitter:
+                        wait_time += random.uniform(0, self.jitter)
                     logger.info(f"Operation failed, retrying in {wait_time} seconds...")
                     time.sleep(wait_time)
                 else:
@@ -214,6 +417,23 @@ class RetryPolicy:
             raise QueryExecutionError("Operation failed after all retry attempts")
 
 
+class QuerySession:
+    """Runs queries for a QueryHandler on one cursor held open by QueryHandler.session()."""
+
+    def __init__(self, handler: QueryHandler, cursor: Cursor):
+        self._handler = handler
+        self._cursor = cursor
+
+    def execute_query(self, query: str, model_class: Optional[Type[T]] = None, fetch_all: bool = True,
+                      batch_size: Optional[int] = None) -> QueryResult[T]:
+        """Execute SQL query on the session cursor and return structured result."""
+        handler = self._handler
+        parser = handler._make_parser(model_class) if model_class else None
+        result = handler._executor._execute_on_cursor(self._cursor, query, parser, fetch_all, batch_size)
+        handler.metrics.add_query_result(result)
+        return result
+
+
 class QueryHandler:
     """Handles query execution and result parsing with improved architecture."""
 
@@ -232,39 +452,77 @@ class QueryHandler:
         """Disconnect from Databricks."""
         self.connection_manager.disconnect()
 
-    def execute_query(self, query: str, model_class: Optional[Type[T]] = None, fetch_all: bool = True) -> QueryResult[T]:
+    def execute_query(self, query: str, model_class: Optional[Type[T]] = None, fetch_all: bool = True,
+                      batch_size: Optional[int] = None) -> QueryResult[T]:
         """Execute SQL query and return structured result."""
-        parser = PydanticResultParser(model_class) if model_class else None
-        result = self._executor.execute_query(query, parser, fetch_all)
+        parser = self._make_parser(model_class) if model_class else None
+        result = self._executor.execute_query(query, parser, fetch_all, batch_size)
+        self.metrics.add_query_result(result)
+        return result
+
+    @contextmanager
+    def session(self) -> Iterator[QuerySession]:
+        """Hold one connection and cursor open across several queries instead of one per query."""
+        with self.connection_manager.get_connection_context() as cursor:
+            yield QuerySession(self, cursor)
+
+    def execute_query_arrow(self, query: str, columns: Optional[List[str]] = None) -> QueryResult:
+        """Execute SQL query and return its rows as a pyarrow.Table in result.arrow_table."""
+        result = self._executor.execute_query(query, ArrowResultParser(columns))
         self.metrics.add_query_result(result)
         return result
 
+    def _make_parser(self, model_class: type) -> ResultParser:
+        """Pick the row parser for a model class according to the parser_backend setting."""
+        if _is_struct_class(model_class):
+            return MsgspecResultParser(model_class)
+        if model_class is not GenericRecord and self.settings.parser_backend == 'msgspec':
+            return MsgspecResultParser(struct_for_model(model_class))
+        return PydanticResultParser(model_class, self.settings.enable_result_pool)
+
     def execute_query_with_retry(self, query: str, model_class: Optional[Type[T]] = None, max_retries: Optional[int] = None) -> QueryResult[T]:
         """Execute query with retry logic."""
         retry_policy = RetryPolicy(max_retries or self.settings.max_retries)
         return retry_policy.execute_with_retry(self.execute_query, query, model_class)
 
     def execute_multiple_queries(self, queries: List[str], model_classes: Optional[List[Type[BaseModel]]] = None) -> Dict[int, QueryResult]:
-        """Execute multiple queries."""
-        results = {}
+        """Execute multiple queries, concurrently when the connection manager is pooled."""
         model_classes = model_classes or [None] * len(queries)
+        jobs = list(zip(queries, model_classes))
+
+        # Only a pooled manager gives each thread its own connection; the default one shares a cursor
+        workers = 1
+        if isinstance(self.connection_manager, PooledConnectionManager):
+            workers = min(self.settings.max_parallel_queries, len(jobs))
+
+        if workers > 1:
+            # Open the pool once up front rather than from every worker at the same time
+            self.connection_manager.ensure_connected()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(self._execute_batch_query, i, len(jobs), query, model_class)
+                    for i, (query, model_class) in enumerate(jobs)
+                ]
+                return {i: future.result() for i, future in enumerate(futures)}
+
+        return {
+            i: self._execute_batch_query(i, len(jobs), query, model_class)
+            for i, (query, model_class) in enumerate(jobs)
+        }
+
+    def _execute_batch_query(self, index: int, total: int, query: str, model_class: Optional[Type[BaseModel]]) -> QueryResult:
+        """Execute one query of a batch, turning a failure into a FAILED result."""
+        logger.info(f"Executing query {index + 1}/{total}")
 
-        for i, (query, model_class) in enumerate(zip(queries, model_classes)):
-            logger.info(f"Executing query {i + 1}/{len(queries)}")
-
-            try:
-                result = self.execute_query_with_retry(query, model_class)
-                results[i] = result
-            except Exception as e:
-                logger.error(f"Query {i + 1} failed: {str(e)}")
-                result = QueryResult(
-                    status=QueryStatus.FAILED,
-                    query=query,
-                    error_message=str(e)
-                )
-                results[i] = result
-
-        return results
+        try:
+            return self.execute_query_with_retry(query, model_class)
+        except Exception as e:
+            logger.error(f"Query {index + 1} failed: {str(e)}")
+            return QueryResult(
+                status=QueryStatus.FAILED,
+                query=query,
+                error_message=str(e)
+            )
 
     # Convenience methods for common operations
     def list_files(self, path: str) -> QueryResult[FileInfo]:
@@ -295,11 +553,11 @@ class QueryHandler:
 
     def get_metrics(self) -> QueryMetrics:
         """Get query execution metrics."""
-        return self.metrics.model_copy()
+        return self.metrics.copy()
 
     def reset_metrics(self) -> None:
         """Reset query metrics."""
-        self.metrics = QueryMetrics()
+        self.metrics.reset()
 
     def test_connection(self) -> bool:
         """Test database connection."""
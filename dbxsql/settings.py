@@ -1,6 +1,6 @@
 """Pydantic settings configuration with dotenv support."""
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import logging
 from pathlib import Path
@@ -32,6 +32,14 @@ class DatabricksSettings(BaseSettings):
     # OAuth settings
     oauth_scope: str = Field(default="all-apis", description="OAuth scope for authentication")
 
+    # Connection pool settings (used by PooledConnectionManager)
+    pool_min_size: int = Field(default=1, description="Connections opened when the pool starts")
+    pool_max_size: int = Field(default=5, description="Maximum open pooled connections")
+    pool_idle_timeout: int = Field(default=300, description="Seconds before an idle pooled connection is replaced")
+    max_parallel_queries: int = Field(default=4, description="Worker threads for execute_multiple_queries on a pooled connection manager")
+    parser_backend: str = Field(default="pydantic", description="Row parser backend: 'pydantic' or 'msgspec'")
+    enable_result_pool: bool = Field(default=False, description="Reuse GenericRecord instances handed back via release_records")
+
     @field_validator('log_level')
     @classmethod
     def validate_log_level(cls, v: str) -> str:
@@ -49,7 +57,24 @@ class DatabricksSettings(BaseSettings):
             raise ValueError('max_retries must be between 0 and 10')
         return v
 
-    @field_validator('query_timeout', 'connection_timeout')
+    @field_validator('parser_backend')
+    @classmethod
+    def validate_parser_backend(cls, v: str) -> str:
+        """Validate parser backend."""
+        valid_backends = ['pydantic', 'msgspec']
+        if v.lower() not in valid_backends:
+            raise ValueError(f'Parser backend must be one of {valid_backends}')
+        return v.lower()
+
+    @field_validator('pool_min_size', 'pool_max_size', 'max_parallel_queries')
+    @classmethod
+    def validate_at_least_one(cls, v: int, info) -> int:
+        """Validate pool sizes and worker counts."""
+        if v < 1:
+            raise ValueError(f'{info.field_name} must be at least 1')
+        return v
+
+    @field_validator('query_timeout', 'connection_timeout', 'pool_idle_timeout')
     @classmethod
     def validate_timeouts(cls, v: int) -> int:
         """Validate timeout values."""
@@ -73,6 +98,13 @@ class DatabricksSettings(BaseSettings):
             raise ValueError('HTTP path must start with /')
         return v
 
+    @model_validator(mode='after')
+    def validate_pool_sizes(self) -> 'DatabricksSettings':
+        """Validate the pool can hold the connections it warms up."""
+        if self.pool_min_size > self.pool_max_size:
+            raise ValueError('pool_min_size must not exceed pool_max_size')
+        return self
+
     def get_token_url(self) -> str:
         """Get the OAuth token URL."""
         return f"https://{self.server_hostname}/oidc/v1/token"
@@ -1,16 +1,19 @@
 """Pytest configuration and shared fixtures."""
 
+import copy
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock
 from datetime import datetime
 
 from dbxsql.settings import DatabricksSettings
-from dbxsql.models import ConnectionInfo, QueryResult, QueryStatus
-from dbxsql.auth import OAuthManager
-from dbxsql.connection import ConnectionManager
+from dbxsql.models import ConnectionInfo, FileInfo, QueryResult, QueryStatus, TableInfo
 
+# Fixed timestamp for fixture data; no test asserts on the wall clock here
+_FIXED_NOW = datetime(2023, 1, 1, 12, 0, 0)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_settings():
     """Sample settings fixture for testing."""
     return DatabricksSettings(
@@ -25,36 +28,57 @@ def sample_settings():
     )
 
 
-@pytest.fixture
-def mock_oauth_manager():
-    """Mock OAuth manager fixture."""
-    manager = Mock(spec=OAuthManager)
-    manager.get_access_token.return_value = "mock_access_token"
-    manager.is_authenticated.return_value = True
-    manager.get_token_info.return_value = {
+def stub(**attrs):
+    """Build a stub-only test double: canned attributes, no call recording."""
+    return SimpleNamespace(**attrs)
+
+
+@pytest.fixture(scope="session")
+def _session_oauth_manager():
+    """OAuth manager stub built once per session."""
+    token_info = {
         'has_token': True,
         'is_expired': False,
-        'expires_at': datetime.now().isoformat(),
+        'expires_at': _FIXED_NOW.isoformat(),
         'expires_in_seconds': 3600
     }
-    return manager
+    return stub(
+        get_access_token=lambda force_refresh=False: "mock_access_token",
+        invalidate_token=lambda: None,
+        is_authenticated=lambda: True,
+        get_token_info=lambda: token_info,
+    )
 
 
 @pytest.fixture
-def mock_connection_manager():
-    """Mock connection manager fixture."""
-    manager = Mock(spec=ConnectionManager)
-    manager.connect.return_value = True
-    manager.is_connected.return_value = True
-    manager.test_connection.return_value = True
-    manager.get_connection_info.return_value = ConnectionInfo(
+def mock_oauth_manager(_session_oauth_manager):
+    """OAuth manager stub fixture; attribute overrides stay local to the test."""
+    return copy.copy(_session_oauth_manager)
+
+
+@pytest.fixture(scope="session")
+def _session_connection_manager():
+    """Connection manager stub built once per session."""
+    connection_info = ConnectionInfo(
         server_hostname="test.databricks.com",
         http_path="/sql/1.0/warehouses/test",
         is_connected=True,
-        connection_time=datetime.now(),
-        last_activity=datetime.now()
+        connection_time=_FIXED_NOW,
+        last_activity=_FIXED_NOW
+    )
+    return stub(
+        connect=lambda: True,
+        disconnect=lambda: None,
+        is_connected=lambda: True,
+        test_connection=lambda: True,
+        get_connection_info=lambda: connection_info,
     )
-    return manager
+
+
+@pytest.fixture
+def mock_connection_manager(_session_connection_manager):
+    """Connection manager stub fixture; attribute overrides stay local to the test."""
+    return copy.copy(_session_connection_manager)
 
 
 @pytest.fixture
@@ -81,40 +105,100 @@ def sample_failed_query_result():
     )
 
 
-@pytest.fixture(autouse=True)
-def reset_model_registry():
-    """Reset model registry after each test to prevent side effects."""
+def _model_factory(model_class, **defaults):
+    """Build a factory that validates the default instance once and copies it per call."""
+    template = model_class(**defaults)
+
+    def build(**overrides):
+        if overrides:
+            return model_class(**{**defaults, **overrides})
+        return template.model_copy(deep=True)
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def file_info_factory():
+    """Factory for FileInfo instances; keyword overrides replace the defaults."""
+    return _model_factory(
+        FileInfo,
+        path="/test/path/file.txt",
+        name="file.txt",
+        size=1024,
+        modification_time=_FIXED_NOW,
+        is_directory=False
+    )
+
+
+@pytest.fixture(scope="session")
+def table_info_factory():
+    """Factory for TableInfo instances; keyword overrides replace the defaults."""
+    return _model_factory(
+        TableInfo,
+        database="test_db",
+        table_name="test_table",
+        is_temporary=True,
+        table_type="MANAGED"
+    )
+
+
+@pytest.fixture(scope="session")
+def query_result_factory():
+    """Factory for QueryResult instances; keyword overrides replace the defaults."""
+    return _model_factory(QueryResult, status=QueryStatus.SUCCESS)
+
+
+@pytest.fixture(scope="session")
+def _original_model_registry():
+    """Snapshot of the model registry taken once per session."""
     from dbxsql.models import MODEL_REGISTRY
+    return MODEL_REGISTRY.copy()
+
 
-    # Store original registry
-    original_registry = MODEL_REGISTRY.copy()
+@pytest.fixture(autouse=True)
+def reset_model_registry(_original_model_registry):
+    """Reset model registry after each test to prevent side effects."""
+    from dbxsql import models
 
     yield
 
-    # Restore original registry
-    MODEL_REGISTRY.clear()
-    MODEL_REGISTRY.update(original_registry)
+    # Only restore when register_model was called during the test
+    if models._registry_dirty:
+        models.MODEL_REGISTRY.clear()
+        models.MODEL_REGISTRY.update(_original_model_registry)
+        models._REGISTRY_KEYS = frozenset(_original_model_registry)
+        models.get_model_class.cache_clear()
+        models._registry_dirty = False
 
 
-@pytest.fixture
-def mock_databricks_cursor():
-    """Mock databricks cursor fixture with common methods."""
+@pytest.fixture(scope="session")
+def _session_databricks_cursor():
+    """Databricks cursor mock built once per session."""
     cursor = Mock()
-    cursor.description = [
-        ('id', 'int'),
-        ('name', 'string'),
-        ('value', 'float')
-    ]
-    cursor.fetchall.return_value = [(1, 'test', 123.45)]
-    cursor.fetchone.return_value = (1, 'test', 123.45)
-    cursor.execute.return_value = None
-    cursor.close.return_value = None
+    cursor.configure_mock(
+        description=[
+            ('id', 'int'),
+            ('name', 'string'),
+            ('value', 'float')
+        ],
+        fetchall=Mock(return_value=[(1, 'test', 123.45)]),
+        fetchone=Mock(return_value=(1, 'test', 123.45)),
+        execute=Mock(return_value=None),
+        close=Mock(return_value=None)
+    )
     return cursor
 
 
 @pytest.fixture
-def mock_databricks_connection():
-    """Mock databricks connection fixture."""
+def mock_databricks_cursor(_session_databricks_cursor):
+    """Mock databricks cursor fixture with common methods."""
+    yield _session_databricks_cursor
+    _session_databricks_cursor.reset_mock(return_value=False, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def _session_databricks_connection():
+    """Databricks connection mock built once per session."""
     connection = Mock()
     cursor = Mock()
     cursor.description = [('test_column', 'string')]
@@ -124,36 +208,53 @@ def mock_databricks_connection():
     return connection
 
 
+@pytest.fixture
+def mock_databricks_connection(_session_databricks_connection):
+    """Mock databricks connection fixture."""
+    yield _session_databricks_connection
+    _session_databricks_connection.reset_mock(return_value=False, side_effect=True)
+
+
 # Test utilities
+_FILE_INFO_DATA = (
+    ('path1', 'file1.txt', 1024, _FIXED_NOW, False),
+    ('path2', 'file2.txt', 2048, _FIXED_NOW, False),
+    ('path3', 'directory', None, _FIXED_NOW, True)
+)
+
+_NEXSYS_RECORD_DATA = (
+    (1, 'Record 1', _FIXED_NOW, 'active', 100.50),
+    (2, 'Record 2', _FIXED_NOW, 'inactive', 200.75),
+    (3, 'Record 3', _FIXED_NOW, 'active', 300.25)
+)
+
+_SALES_RECORD_DATA = (
+    ('TXN001', 'CUST001', 'PROD001', 2, 10.50, 21.00, _FIXED_NOW),
+    ('TXN002', 'CUST002', 'PROD002', 1, 15.75, 15.75, _FIXED_NOW),
+    ('TXN003', 'CUST001', 'PROD003', 3, 8.25, 24.75, _FIXED_NOW)
+)
+
+
 class TestDataBuilder:
-    """Builder class for creating test data."""
+    """Builder class for creating test data.
+
+    The returned rows are shared, immutable tuples; wrap them in list() before mutating.
+    """
 
     @staticmethod
     def create_file_info_data():
         """Create sample file info data."""
-        return [
-            ('path1', 'file1.txt', 1024, datetime.now(), False),
-            ('path2', 'file2.txt', 2048, datetime.now(), False),
-            ('path3', 'directory', None, datetime.now(), True)
-        ]
+        return _FILE_INFO_DATA
 
     @staticmethod
     def create_nexsys_record_data():
         """Create sample nexsys record data."""
-        return [
-            (1, 'Record 1', datetime.now(), 'active', 100.50),
-            (2, 'Record 2', datetime.now(), 'inactive', 200.75),
-            (3, 'Record 3', datetime.now(), 'active', 300.25)
-        ]
+        return _NEXSYS_RECORD_DATA
 
     @staticmethod
     def create_sales_record_data():
         """Create sample sales record data."""
-        return [
-            ('TXN001', 'CUST001', 'PROD001', 2, 10.50, 21.00, datetime.now()),
-            ('TXN002', 'CUST002', 'PROD002', 1, 15.75, 15.75, datetime.now()),
-            ('TXN003', 'CUST001', 'PROD003', 3, 8.25, 24.75, datetime.now())
-        ]
+        return _SALES_RECORD_DATA
 
 
 @pytest.fixture
@@ -162,6 +263,14 @@ def test_data_builder():
     return TestDataBuilder()
 
 
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--integration", action="store_true", default=False,
+        help="run tests marked as integration"
+    )
+
+
 # Markers for test categories
 def pytest_configure(config):
     """Configure custom pytest markers."""
@@ -179,14 +288,16 @@ def pytest_configure(config):
     )
 
 
-# Skip integration tests by default unless explicitly requested
+# Deselect integration tests by default unless explicitly requested
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to handle markers."""
-    # if config.getoption("--integration"):
-    #     # If --integration flag is passed, run all tests
-    #     return
-
-    skip_integration = pytest.mark.skip(reason="need --integration option to run")
-    for item in items:
-        if "integration" in item.keywords:
-            item.add_marker(skip_integration)
\ No newline at end of file
+    if config.getoption("--integration"):
+        # If --integration flag is passed, run all tests
+        return
+
+    selected = [item for item in items if "integration" not in item.keywords]
+    if len(selected) != len(items):
+        config.hook.pytest_deselected(
+            items=[item for item in items if "integration" in item.keywords]
+        )
+        items[:] = selected
@@ -1,39 +1,59 @@
 """Tests for authentication module."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 import requests
 
+import dbxsql.auth as _auth_mod
 from dbxsql.auth import OAuthManager, TokenProvider
-from dbxsql.settings import DatabricksSettings
 from dbxsql.exceptions import AuthenticationError
 
+_TOKEN_URL = 'https://test.databricks.com/oidc/v1/token'
+
+# Keyword arguments OAuthManager passes to requests.post for the stub settings below
+_EXPECTED_TOKEN_CALL = dict(
+    data={
+        'grant_type': 'client_credentials',
+        'scope': 'all-apis'
+    },
+    auth=('test_client_id', 'test_client_secret'),
+    headers={'Content-Type': 'application/x-www-form-urlencoded'},
+    timeout=30
+)
+
 
 class TestOAuthManager:
     """Test cases for OAuthManager."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_settings(self):
-        """Mock settings fixture."""
-        settings = Mock(spec=DatabricksSettings)
-        settings.client_id = "test_client_id"
-        settings.client_secret = "test_client_secret"
-        settings.oauth_scope = "all-apis"
-        settings.connection_timeout = 30
-        settings.get_token_url.return_value = "https://test.databricks.com/oidc/v1/token"
-        return settings
+        """Stub settings fixture."""
+        return SimpleNamespace(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            oauth_scope="all-apis",
+            connection_timeout=30,
+            get_token_url=lambda: _TOKEN_URL
+        )
 
     @pytest.fixture
     def oauth_manager(self, mock_settings):
         """OAuth manager fixture."""
         return OAuthManager(mock_settings)
 
-    def test_oauth_manager_implements_token_provider(self, oauth_manager):
+    @pytest.fixture(autouse=True)
+    def mock_post(self, monkeypatch):
+        """Replace requests.post in the auth module for every test."""
+        post = Mock()
+        monkeypatch.setattr(_auth_mod.requests, 'post', post)
+        return post
+
+    def test_oauth_manager_implements_token_provider(self):
         """Test that OAuthManager implements TokenProvider protocol."""
-        assert isinstance(oauth_manager, TokenProvider)
+        assert issubclass(OAuthManager, TokenProvider)
 
-    @patch('dbxsql.auth.requests.post')
     def test_successful_token_refresh(self, mock_post, oauth_manager, mock_settings):
         """Test successful token refresh."""
         # Mock successful response
@@ -51,18 +71,8 @@ class TestOAuthManager:
         assert oauth_manager.is_authenticated()
 
         # Verify the request was made correctly
-        mock_post.assert_called_once_with(
-            'https://test.databricks.com/oidc/v1/token',
-            data={
-                'grant_type': 'client_credentials',
-                'scope': 'all-apis'
-            },
-            auth=('test_client_id', 'test_client_secret'),
-            headers={'Content-Type': 'application/x-www-form-urlencoded'},
-            timeout=30
-        )
+        mock_post.assert_called_once_with(_TOKEN_URL, **_EXPECTED_TOKEN_CALL)
 
-    @patch('dbxsql.auth.requests.post')
     def test_token_not_refreshed_when_valid(self, mock_post, oauth_manager):
         """Test that valid token is not refreshed unnecessarily."""
         # Set up a valid token
@@ -75,7 +85,6 @@ class TestOAuthManager:
         # Should not make HTTP request
         mock_post.assert_not_called()
 
-    @patch('dbxsql.auth.requests.post')
     def test_force_refresh_token(self, mock_post, oauth_manager):
         """Test force refresh of valid token."""
         # Set up a valid token
@@ -96,7 +105,6 @@ class TestOAuthManager:
         assert token == 'new_access_token'
         mock_post.assert_called_once()
 
-    @patch('dbxsql.auth.requests.post')
     def test_token_refresh_failure_http_error(self, mock_post, oauth_manager):
         """Test token refresh failure with HTTP error."""
         # Mock failed response
@@ -111,7 +119,6 @@ class TestOAuthManager:
         assert "Failed to get OAuth token: 400" in str(exc_info.value)
         assert "Invalid client credentials" in str(exc_info.value)
 
-    @patch('dbxsql.auth.requests.post')
     def test_token_refresh_network_error(self, mock_post, oauth_manager):
         """Test token refresh failure with network error."""
         # Mock network error
@@ -122,7 +129,6 @@ class TestOAuthManager:
 
         assert "Network error while getting OAuth token" in str(exc_info.value)
 
-    @patch('dbxsql.auth.requests.post')
     def test_token_refresh_unexpected_error(self, mock_post, oauth_manager):
         """Test token refresh failure with unexpected error."""
         # Mock unexpected error
@@ -133,7 +139,6 @@ class TestOAuthManager:
 
         assert "Unexpected error during authentication" in str(exc_info.value)
 
-    @patch('dbxsql.auth.requests.post')
     def test_invalid_token_response(self, mock_post, oauth_manager):
         """Test handling of invalid token response."""
         # Mock response without access_token
@@ -147,27 +152,28 @@ class TestOAuthManager:
 
         assert "Invalid token response: missing access_token" in str(exc_info.value)
 
-    def test_token_expiry_check(self, oauth_manager):
-        """Test token expiry checking logic."""
-        # No token - should be expired
-        assert oauth_manager._is_token_expired()
-
-        # Valid token with future expiry
-        oauth_manager._access_token = 'token'
-        oauth_manager._token_expiry = datetime.now() + timedelta(hours=1)
-        assert not oauth_manager._is_token_expired()
-
-        # Token expiring soon (within buffer time)
-        oauth_manager._token_expiry = datetime.now() + timedelta(minutes=3)
-        assert oauth_manager._is_token_expired()
-
-        # Expired token
-        oauth_manager._token_expiry = datetime.now() - timedelta(minutes=10)
-        assert oauth_manager._is_token_expired()
-
-    @patch('dbxsql.auth.requests.post')
-    def test_default_token_expiry(self, mock_post, oauth_manager):
+    @pytest.mark.parametrize("token, minutes, buffer_minutes, expected_expired", [
+        (None, 0, 5, True),  # no token
+        ("token", 60, 5, False),  # valid token with future expiry
+        ("token", 3, 5, True),  # expiring within buffer time
+        ("token", 3, 1, False),  # same expiry with a smaller buffer
+        ("token", -10, 5, True),  # expired token
+    ])
+    def test_expiry_matrix(self, oauth_manager, token, minutes, buffer_minutes, expected_expired):
+        """Test token expiry and authentication status across expiry states."""
+        oauth_manager._access_token = token
+        oauth_manager._token_expiry = datetime.now() + timedelta(minutes=minutes) if token else None
+        oauth_manager._token_buffer_minutes = buffer_minutes
+
+        assert oauth_manager._is_token_expired() is expected_expired
+        assert oauth_manager.is_authenticated() is not expected_expired
+
+    @patch.object(_auth_mod, 'datetime')
+    def test_default_token_expiry(self, mock_datetime, mock_post, oauth_manager):
         """Test default token expiry when not provided."""
+        fixed_time = datetime(2023, 1, 1, 12, 0, 0)
+        mock_datetime.now.return_value = fixed_time
+
         # Mock response without expires_in
         mock_response = Mock()
         mock_response.status_code = 200
@@ -178,9 +184,7 @@ class TestOAuthManager:
 
         assert token == 'test_token'
         # Should set default expiry of 1 hour
-        expected_expiry = datetime.now() + timedelta(seconds=3600)
-        # Allow some tolerance for test execution time
-        assert abs((oauth_manager._token_expiry - expected_expiry).total_seconds()) < 5
+        assert oauth_manager._token_expiry == fixed_time + timedelta(seconds=3600)
 
     def test_invalidate_token(self, oauth_manager):
         """Test token invalidation."""
@@ -196,20 +200,6 @@ class TestOAuthManager:
         assert oauth_manager._access_token is None
         assert oauth_manager._token_expiry is None
 
-    def test_is_authenticated(self, oauth_manager):
-        """Test authentication status checking."""
-        # No token
-        assert not oauth_manager.is_authenticated()
-
-        # Valid token
-        oauth_manager._access_token = 'token'
-        oauth_manager._token_expiry = datetime.now() + timedelta(hours=1)
-        assert oauth_manager.is_authenticated()
-
-        # Expired token
-        oauth_manager._token_expiry = datetime.now() - timedelta(hours=1)
-        assert not oauth_manager.is_authenticated()
-
     def test_get_token_info(self, oauth_manager):
         """Test getting token information."""
         # No token
@@ -231,7 +221,6 @@ class TestOAuthManager:
         assert isinstance(info['expires_in_seconds'], int)
         assert info['expires_in_seconds'] > 0
 
-    @patch('dbxsql.auth.requests.post')
     def test_get_access_token_no_valid_token_after_refresh(self, mock_post, oauth_manager):
         """Test error when no valid token after refresh attempt."""
         # Mock successful response but somehow token is not set
@@ -252,22 +241,8 @@ class TestOAuthManager:
 
         assert "No valid access token available" in str(exc_info.value)
 
-    def test_token_buffer_minutes_configuration(self, oauth_manager):
-        """Test that token buffer minutes can be configured."""
-        # Set token that would normally be valid but within buffer
-        oauth_manager._access_token = 'token'
-        oauth_manager._token_expiry = datetime.now() + timedelta(minutes=3)
-
-        # Should be considered expired due to buffer
-        assert oauth_manager._is_token_expired()
-
-        # Change buffer and test
-        oauth_manager._token_buffer_minutes = 1
-        assert not oauth_manager._is_token_expired()
-
-    @patch('dbxsql.auth.datetime')
-    @patch('dbxsql.auth.requests.post')
-    def test_token_expiry_calculation(self, mock_post, mock_datetime, oauth_manager):
+    @patch.object(_auth_mod, 'datetime')
+    def test_token_expiry_calculation(self, mock_datetime, mock_post, oauth_manager):
         """Test token expiry calculation."""
         fixed_time = datetime(2023, 1, 1, 12, 0, 0)
         mock_datetime.now.return_value = fixed_time
@@ -1,31 +1,39 @@
 """Tests for connection module."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 from datetime import datetime
 from contextlib import contextmanager
+import threading
+import time
 
-from dbxsql.connection import ConnectionManager, ConnectionManagerInterface, AuthenticationManagerProtocol
-from dbxsql.settings import DatabricksSettings
+from dbxsql.connection import (
+    ConnectionManager, ConnectionManagerInterface, AuthenticationManagerProtocol,
+    ConnectionPool, PooledConnectionManager
+)
 from dbxsql.models import ConnectionInfo
 from dbxsql.exceptions import ConnectionError
 
+# Attribute list computed once so Mock(spec=...) skips dir() on every construction
+_AUTH_MANAGER_SPEC = dir(AuthenticationManagerProtocol)
+
 
 class TestConnectionManager:
     """Test cases for ConnectionManager."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_settings(self):
-        """Mock settings fixture."""
-        settings = Mock(spec=DatabricksSettings)
-        settings.server_hostname = "test.databricks.com"
-        settings.http_path = "/sql/1.0/warehouses/test"
-        return settings
+        """Stub settings fixture."""
+        return SimpleNamespace(
+            server_hostname="test.databricks.com",
+            http_path="/sql/1.0/warehouses/test"
+        )
 
     @pytest.fixture
     def mock_auth_manager(self):
         """Mock authentication manager fixture."""
-        auth_manager = Mock(spec=AuthenticationManagerProtocol)
+        auth_manager = Mock(spec=_AUTH_MANAGER_SPEC)
         auth_manager.get_access_token.return_value = "test_access_token"
         return auth_manager
 
@@ -103,11 +111,11 @@ class TestConnectionManager:
         assert "Connection failed" in str(exc_info.value)
         assert not connection_manager.is_connected()
 
-    def test_disconnect(self, connection_manager):
+    def test_disconnect(self, connection_manager, mock_databricks_cursor, mock_databricks_connection):
         """Test disconnection."""
         # Set up connected state
-        mock_cursor = Mock()
-        mock_connection = Mock()
+        mock_cursor = mock_databricks_cursor
+        mock_connection = mock_databricks_connection
         connection_manager._cursor = mock_cursor
         connection_manager._connection = mock_connection
         connection_manager._connection_info.is_connected = True
@@ -121,12 +129,12 @@ class TestConnectionManager:
         assert connection_manager._cursor is None
         assert connection_manager._connection is None
 
-    def test_disconnect_with_errors(self, connection_manager):
+    def test_disconnect_with_errors(self, connection_manager, mock_databricks_cursor, mock_databricks_connection):
         """Test disconnection when cursor/connection close raises errors."""
         # Set up connected state with problematic objects
-        mock_cursor = Mock()
+        mock_cursor = mock_databricks_cursor
         mock_cursor.close.side_effect = Exception("Cursor close error")
-        mock_connection = Mock()
+        mock_connection = mock_databricks_connection
         mock_connection.close.side_effect = Exception("Connection close error")
 
         connection_manager._cursor = mock_cursor
@@ -182,13 +190,11 @@ class TestConnectionManager:
         assert connection_manager._connection_info.last_activity != old_activity
 
     @patch('dbxsql.connection.sql.connect')
-    def test_get_cursor_success(self, mock_sql_connect, connection_manager):
+    def test_get_cursor_success(self, mock_sql_connect, connection_manager, mock_databricks_connection):
         """Test getting cursor successfully."""
         # Mock successful connection
-        mock_connection = Mock()
-        mock_cursor = Mock()
-        mock_connection.cursor.return_value = mock_cursor
-        mock_sql_connect.return_value = mock_connection
+        mock_cursor = mock_databricks_connection.cursor.return_value
+        mock_sql_connect.return_value = mock_databricks_connection
 
         cursor = connection_manager.get_cursor()
 
@@ -208,11 +214,12 @@ class TestConnectionManager:
         assert "Failed to get database cursor" in str(exc_info.value)
 
     @patch('dbxsql.connection.sql.connect')
-    def test_refresh_connection(self, mock_sql_connect, connection_manager):
+    def test_refresh_connection(self, mock_sql_connect, connection_manager,
+                                mock_databricks_cursor, mock_databricks_connection):
         """Test connection refresh."""
         # Set up initial connection
-        old_connection = Mock()
-        old_cursor = Mock()
+        old_connection = mock_databricks_connection
+        old_cursor = mock_databricks_cursor
         connection_manager._connection = old_connection
         connection_manager._cursor = old_cursor
         connection_manager._connection_info.is_connected = True
@@ -231,4 +238,177 @@ class TestConnectionManager:
 
         # Verify new connection was established
         assert connection_manager._connection == new_connection
-        assert connection_manager._cursor == new_cursor
\ No newline at end of file
+        assert connection_manager._cursor == new_cursor
+
+
+class TestConnectionPool:
+    """Test cases for ConnectionPool."""
+
+    def test_acquire_reuses_released_connection(self):
+        """Test a released connection is handed out again instead of opening a new one."""
+        connect = Mock(side_effect=lambda: Mock())
+        pool = ConnectionPool(connect, max_size=2)
+
+        first = pool.acquire()
+        pool.release(first)
+
+        assert pool.acquire() is first
+        assert connect.call_count == 1
+
+    def test_acquire_times_out_at_max_size(self):
+        """Test acquire fails when every connection is in use."""
+        pool = ConnectionPool(Mock, max_size=1)
+        pool.acquire()
+
+        with pytest.raises(ConnectionError):
+            pool.acquire(timeout=0.01)
+
+    def test_acquire_timeout_is_not_reset_by_wakeups(self):
+        """Test notifications that free nothing do not extend the acquire timeout."""
+        pool = ConnectionPool(Mock, max_size=1)
+        pool.acquire()
+        stop = threading.Event()
+
+        def keep_waking():
+            # Bounded so a regression fails the timing assert instead of hanging
+            give_up = time.monotonic() + 1
+            while not stop.is_set() and time.monotonic() < give_up:
+                with pool._condition:
+                    pool._condition.notify_all()
+                time.sleep(0.01)
+
+        waker = threading.Thread(target=keep_waking)
+        waker.start()
+        started = time.monotonic()
+        try:
+            with pytest.raises(ConnectionError):
+                pool.acquire(timeout=0.1)
+        finally:
+            stop.set()
+            waker.join()
+
+        assert time.monotonic() - started < 1
+
+    def test_expired_idle_connection_is_replaced(self):
+        """Test idle connections older than idle_timeout are closed and replaced."""
+        pool = ConnectionPool(Mock, max_size=1, idle_timeout=0)
+        old_connection = pool.acquire()
+        pool.release(old_connection)
+
+        new_connection = pool.acquire()
+
+        assert new_connection is not old_connection
+        old_connection.close.assert_called_once()
+        assert pool.size == 1
+
+    def test_discard_and_close(self):
+        """Test discarded connections are closed and close() empties the pool."""
+        pool = ConnectionPool(Mock, max_size=2)
+        broken, healthy = pool.acquire(), pool.acquire()
+
+        pool.release(broken, discard=True)
+        pool.release(healthy)
+        pool.close()
+
+        broken.close.assert_called_once()
+        healthy.close.assert_called_once()
+        assert pool.size == 0
+        with pytest.raises(ConnectionError):
+            pool.acquire()
+
+
+class TestPooledConnectionManager:
+    """Test cases for PooledConnectionManager."""
+
+    @pytest.fixture(scope="module")
+    def mock_settings(self):
+        """Stub settings fixture."""
+        return SimpleNamespace(
+            server_hostname="test.databricks.com",
+            http_path="/sql/1.0/warehouses/test",
+            pool_min_size=1,
+            pool_max_size=2,
+            pool_idle_timeout=300,
+            connection_timeout=30
+        )
+
+    @pytest.fixture
+    def connection_manager(self, mock_settings):
+        """Pooled connection manager fixture."""
+        auth_manager = Mock(spec=_AUTH_MANAGER_SPEC)
+        auth_manager.get_access_token.return_value = "test_access_token"
+        return PooledConnectionManager(mock_settings, auth_manager)
+
+    @patch('dbxsql.connection.sql.connect')
+    def test_connection_context_uses_pooled_connection(self, mock_sql_connect, connection_manager):
+        """Test each context gets a fresh cursor and returns the connection to the pool."""
+        connection_manager.connect()
+
+        with connection_manager.get_connection_context() as cursor:
+            cursor.execute("SELECT 1")
+
+        connection = mock_sql_connect.return_value
+        connection.cursor.return_value.close.assert_called_once()
+        assert mock_sql_connect.call_count == 1
+        assert connection_manager.pool.idle_count == 1
+
+    @patch('dbxsql.connection.sql.connect')
+    def test_connection_error_discards_connection(self, mock_sql_connect, connection_manager):
+        """Test a connection-related error drops the connection from the pool."""
+        connection_manager.connect()
+
+        with pytest.raises(RuntimeError):
+            with connection_manager.get_connection_context():
+                raise RuntimeError("connection reset")
+
+        mock_sql_connect.return_value.close.assert_called_once()
+        assert connection_manager.pool.size == 0
+
+    @patch('dbxsql.connection.sql.connect')
+    def test_concurrent_connect_opens_one_pool(self, mock_sql_connect, connection_manager):
+        """Test threads connecting at once share a single warmed pool."""
+        def slow_connect(**kwargs):
+            time.sleep(0.01)
+            return Mock()
+
+        mock_sql_connect.side_effect = slow_connect
+        threads = [threading.Thread(target=connection_manager.connect) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_sql_connect.call_count == 1
+        assert connection_manager.pool.size == 1
+
+    @patch('dbxsql.connection.sql.connect')
+    def test_connect_warms_at_most_max_size(self, mock_sql_connect, mock_settings):
+        """Test a min size above the max size warms max_size connections instead of blocking."""
+        settings = SimpleNamespace(**vars(mock_settings) | {"pool_min_size": 3})
+        auth_manager = Mock(spec=_AUTH_MANAGER_SPEC)
+        auth_manager.get_access_token.return_value = "test_access_token"
+        connection_manager = PooledConnectionManager(settings, auth_manager)
+
+        assert connection_manager.connect() is True
+        assert mock_sql_connect.call_count == 2
+        assert connection_manager.pool.idle_count == 2
+
+    def test_connect_warm_up_acquire_times_out(self, connection_manager, mock_settings):
+        """Test the warm-up acquire is bounded by connection_timeout."""
+        with patch.object(ConnectionPool, 'acquire', side_effect=ConnectionError("No pooled connection available")) as mock_acquire:
+            with pytest.raises(ConnectionError, match="Failed to connect to Databricks"):
+                connection_manager.connect()
+
+        mock_acquire.assert_called_once_with(timeout=mock_settings.connection_timeout)
+        assert not connection_manager.is_connected()
+
+    @patch('dbxsql.connection.sql.connect')
+    def test_disconnect_closes_pool(self, mock_sql_connect, connection_manager):
+        """Test disconnect closes pooled connections."""
+        connection_manager.connect()
+        assert connection_manager.is_connected()
+
+        connection_manager.disconnect()
+
+        assert not connection_manager.is_connected()
+        mock_sql_connect.return_value.close.assert_called_once()
@@ -2,23 +2,26 @@
 
 import pytest
 import os
-from unittest.mock import patch, Mock
+from unittest.mock import Mock
 from datetime import datetime
 
-from dbxsql import QueryHandler, settings, GenericRecord, NexsysRecord
-from dbxsql.models import QueryStatus
-from dbxsql.exceptions import AuthenticationError, ConnectionError
+pytestmark = pytest.mark.integration
 
 
-@pytest.mark.integration
 class TestQueryHandlerIntegration:
     """Integration tests for QueryHandler with mocked Databricks connection."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_databricks_environment(self):
         """Mock the entire Databricks environment."""
-        with patch('dbxsql.connection.sql') as mock_sql, \
-                patch('dbxsql.auth.requests') as mock_requests:
+        import dbxsql.auth as auth_module
+        import dbxsql.connection as connection_module
+
+        # Swap the module attributes directly; cheaper than building patch objects
+        mock_sql, mock_requests = Mock(), Mock()
+        original_sql, original_requests = connection_module.sql, auth_module.requests
+        connection_module.sql, auth_module.requests = mock_sql, mock_requests
+        try:
             # Mock successful authentication
             mock_auth_response = Mock()
             mock_auth_response.status_code = 200
@@ -28,4 +31,9 @@ class TestQueryHandlerIntegration:
             }
             mock_requests.post.return_value = mock_auth_response
 
-            # Mock successful connection
\ No newline at end of file
+            # Mock successful connection
+            mock_sql.connect.return_value = Mock()
+
+            yield mock_sql, mock_requests
+        finally:
+            connection_module.sql, auth_module.requests = original_sql, original_requests
@@ -1,14 +1,18 @@
 """Tests for models module."""
 
+import copy
+import pickle
 import pytest
+from dataclasses import asdict, replace
 from datetime import datetime
-from pydantic import ValidationError
-from typing import List
+from pydantic import ValidationError, field_validator
+from typing import List, Optional
 
 from dbxsql.models import (
     QueryStatus, FileInfo, TableInfo, QueryResult, QueryMetrics,
     ConnectionInfo, NexsysRecord, SalesRecord, GenericRecord,
-    get_model_class, register_model, list_available_models, MODEL_REGISTRY
+    get_model_class, register_model, list_available_models, MODEL_REGISTRY,
+    build_tagged_records, RECORD_TAG_KEY, acquire_generic_record, release_records
 )
 
 
@@ -32,15 +36,9 @@ class TestQueryStatus:
 class TestFileInfo:
     """Test cases for FileInfo model."""
 
-    def test_valid_file_info(self):
+    def test_valid_file_info(self, file_info_factory):
         """Test creating valid FileInfo."""
-        file_info = FileInfo(
-            path="/test/path/file.txt",
-            name="file.txt",
-            size=1024,
-            modification_time=datetime.now(),
-            is_directory=False
-        )
+        file_info = file_info_factory()
 
         assert file_info.path == "/test/path/file.txt"
         assert file_info.name == "file.txt"
@@ -57,13 +55,9 @@ class TestFileInfo:
         assert file_info.modification_time is None
         assert not file_info.is_directory
 
-    def test_file_info_directory(self):
+    def test_file_info_directory(self, file_info_factory):
         """Test FileInfo for directory."""
-        file_info = FileInfo(
-            path="/test/directory",
-            name="directory",
-            is_directory=True
-        )
+        file_info = file_info_factory(path="/test/directory", name="directory", is_directory=True)
 
         assert file_info.is_directory
 
@@ -90,14 +84,9 @@ class TestFileInfo:
 class TestTableInfo:
     """Test cases for TableInfo model."""
 
-    def test_valid_table_info(self):
+    def test_valid_table_info(self, table_info_factory):
         """Test creating valid TableInfo."""
-        table_info = TableInfo(
-            database="test_db",
-            table_name="test_table",
-            is_temporary=True,
-            table_type="MANAGED"
-        )
+        table_info = table_info_factory()
 
         assert table_info.database == "test_db"
         assert table_info.table_name == "test_table"
@@ -154,15 +143,22 @@ class TestQueryResult:
         assert result.error_message is None
         assert result.query is None
 
-    def test_query_result_row_count_validation_negative(self):
+    def test_query_result_keeps_raw_rows(self, query_result_factory):
+        """Test QueryResult stores raw rows without copying them."""
+        raw_rows = ((1, "a"), (2, "b"))
+        result = query_result_factory(raw_data=raw_rows, row_count=2)
+
+        assert result.raw_data is raw_rows
+
+    def test_query_result_row_count_validation_negative(self, query_result_factory):
         """Test QueryResult row_count validation with negative value."""
-        result = QueryResult(status=QueryStatus.SUCCESS, row_count=-5)
+        result = query_result_factory(row_count=-5)
         # Should be corrected to 0
         assert result.row_count == 0
 
-    def test_query_result_row_count_validation_positive(self):
+    def test_query_result_row_count_validation_positive(self, query_result_factory):
         """Test QueryResult row_count validation with positive value."""
-        result = QueryResult(status=QueryStatus.SUCCESS, row_count=10)
+        result = query_result_factory(row_count=10)
         assert result.row_count == 10
 
     def test_query_result_with_error(self):
@@ -177,6 +173,22 @@ class TestQueryResult:
         assert result.error_message == "Syntax error in query"
         assert result.query == "SELECT * FROM nonexistent"
 
+    def test_query_result_from_json(self):
+        """Test QueryResult round-trips through JSON."""
+        result = QueryResult[NexsysRecord](
+            status=QueryStatus.SUCCESS,
+            data=[NexsysRecord(id=1, name="Test")],
+            row_count=1
+        )
+        payload = result.model_dump_json()
+
+        untyped = QueryResult.from_json(payload)
+        typed = QueryResult[NexsysRecord].from_json(payload.encode())
+
+        assert untyped.status == QueryStatus.SUCCESS
+        assert untyped.data[0]["name"] == "Test"
+        assert typed.data == result.data
+
 
 class TestQueryMetrics:
     """Test cases for QueryMetrics model."""
@@ -191,13 +203,10 @@ class TestQueryMetrics:
         assert metrics.total_execution_time == 0.0
         assert metrics.average_execution_time is None
 
-    def test_add_successful_query_result(self):
+    def test_add_successful_query_result(self, query_result_factory):
         """Test adding successful query result to metrics."""
         metrics = QueryMetrics()
-        result = QueryResult(
-            status=QueryStatus.SUCCESS,
-            execution_time_seconds=2.0
-        )
+        result = query_result_factory(execution_time_seconds=2.0)
 
         metrics.add_query_result(result)
 
@@ -207,13 +216,10 @@ class TestQueryMetrics:
         assert metrics.total_execution_time == 2.0
         assert metrics.average_execution_time == 2.0
 
-    def test_add_failed_query_result(self):
+    def test_add_failed_query_result(self, query_result_factory):
         """Test adding failed query result to metrics."""
         metrics = QueryMetrics()
-        result = QueryResult(
-            status=QueryStatus.FAILED,
-            execution_time_seconds=1.5
-        )
+        result = query_result_factory(status=QueryStatus.FAILED, execution_time_seconds=1.5)
 
         metrics.add_query_result(result)
 
@@ -223,22 +229,16 @@ class TestQueryMetrics:
         assert metrics.total_execution_time == 1.5
         assert metrics.average_execution_time == 1.5
 
-    def test_add_multiple_query_results(self):
+    def test_add_multiple_query_results(self, query_result_factory):
         """Test adding multiple query results to metrics."""
         metrics = QueryMetrics()
 
         # Add successful result
-        success_result = QueryResult(
-            status=QueryStatus.SUCCESS,
-            execution_time_seconds=2.0
-        )
+        success_result = query_result_factory(execution_time_seconds=2.0)
         metrics.add_query_result(success_result)
 
         # Add failed result
-        failed_result = QueryResult(
-            status=QueryStatus.FAILED,
-            execution_time_seconds=3.0
-        )
+        failed_result = query_result_factory(status=QueryStatus.FAILED, execution_time_seconds=3.0)
         metrics.add_query_result(failed_result)
 
         assert metrics.total_queries == 2
@@ -247,10 +247,10 @@ class TestQueryMetrics:
         assert metrics.total_execution_time == 5.0
         assert metrics.average_execution_time == 2.5
 
-    def test_add_query_result_without_execution_time(self):
+    def test_add_query_result_without_execution_time(self, query_result_factory):
         """Test adding query result without execution time."""
         metrics = QueryMetrics()
-        result = QueryResult(status=QueryStatus.SUCCESS)
+        result = query_result_factory()
 
         metrics.add_query_result(result)
 
@@ -259,6 +259,38 @@ class TestQueryMetrics:
         assert metrics.total_execution_time == 0.0
         assert metrics.average_execution_time == 0.0
 
+    def test_query_metrics_copy_is_independent(self, query_result_factory):
+        """Test copy returns an equal snapshot that later updates do not touch."""
+        metrics = QueryMetrics()
+        metrics.add_query_result(query_result_factory(execution_time_seconds=1.0))
+
+        snapshot = metrics.copy()
+        metrics.add_query_result(query_result_factory(execution_time_seconds=3.0))
+
+        assert snapshot is not metrics
+        assert snapshot.total_queries == 1
+        assert snapshot.average_execution_time == 1.0
+        assert metrics.total_queries == 2
+        assert snapshot._lock is not metrics._lock
+
+    def test_query_metrics_serializes_without_lock(self, query_result_factory):
+        """Test asdict, deepcopy and pickle work and leave the lock out."""
+        metrics = QueryMetrics()
+        metrics.add_query_result(query_result_factory(execution_time_seconds=2.0))
+
+        assert asdict(metrics) == {
+            "total_queries": 1,
+            "successful_queries": 1,
+            "failed_queries": 0,
+            "total_execution_time": 2.0,
+            "average_execution_time": 2.0,
+        }
+        for clone in (copy.deepcopy(metrics), pickle.loads(pickle.dumps(metrics))):
+            assert clone == metrics
+            assert clone._lock is not metrics._lock
+            clone.add_query_result(query_result_factory(execution_time_seconds=4.0))
+            assert clone.total_queries == 2
+
 
 class TestConnectionInfo:
     """Test cases for ConnectionInfo model."""
@@ -276,6 +308,33 @@ class TestConnectionInfo:
         assert conn_info.connection_time is None
         assert conn_info.last_activity is None
 
+    def test_connection_info_equality(self):
+        """Test that equality follows the public fields and last_activity, not the clock readings."""
+        activity = datetime(2024, 1, 1, 12, 0, 0)
+        first = ConnectionInfo(server_hostname="test.com", http_path="/test", last_activity=activity)
+        second = ConnectionInfo(server_hostname="test.com", http_path="/test", last_activity=activity)
+
+        assert first == second
+        assert first != ConnectionInfo(server_hostname="other.com", http_path="/test", last_activity=activity)
+        assert first != ConnectionInfo(server_hostname="test.com", http_path="/test")
+
+    def test_connection_info_replace_and_model_dump(self):
+        """Test replace() accepts public fields and model_dump() reports last_activity."""
+        activity = datetime(2024, 1, 1, 12, 0, 0)
+        info = ConnectionInfo(server_hostname="test.com", http_path="/test", is_connected=True, last_activity=activity)
+
+        disconnected = replace(info, is_connected=False)
+
+        assert disconnected.is_connected is False
+        assert disconnected.server_hostname == "test.com"
+        assert info.model_dump() == {
+            "server_hostname": "test.com",
+            "http_path": "/test",
+            "is_connected": True,
+            "connection_time": None,
+            "last_activity": activity,
+        }
+
     def test_mark_connected(self):
         """Test mark_connected method."""
         conn_info = ConnectionInfo(
@@ -352,10 +411,69 @@ class TestNexsysRecord:
 
         assert record.id == 1
         assert record.name == "Test"
-        # Extra fields should be allowed but not directly accessible
+        # Extra fields are collected into extras and stay readable as attributes
+        assert record.extras == {"extra_field": "extra_value"}
         assert hasattr(record, 'extra_field')
         assert record.extra_field == "extra_value"
 
+    def test_nexsys_record_from_trusted_matches_validated(self):
+        """Test from_trusted builds the same record as validation."""
+        data = {"id": 1, "status": "active", "extra_field": "extra_value"}
+
+        trusted = NexsysRecord.from_trusted(data)
+        validated = NexsysRecord(**data)
+
+        assert trusted == validated
+        assert trusted.model_dump() == validated.model_dump()
+        assert trusted.model_fields_set == validated.model_fields_set
+        assert trusted.name is None
+        assert trusted.extra_field == "extra_value"
+
+    def test_nexsys_record_subclass_fields_not_moved_to_extras(self):
+        """Test a subclass's required fields validate as fields rather than extras."""
+        class RegionalRecord(NexsysRecord):
+            region: str
+
+        record = RegionalRecord(id=1, region="eu", extra_field="x")
+
+        assert record.region == "eu"
+        assert record.extras == {"extra_field": "x"}
+
+    def test_nexsys_record_from_trusted_subclass_fields(self):
+        """Test from_trusted keeps a subclass's declared fields out of extras."""
+        class RegionalRecord(NexsysRecord):
+            region: Optional[str] = None
+
+        record = RegionalRecord.from_trusted({"id": 1, "region": "eu", "extra_field": "x"})
+
+        assert isinstance(record, RegionalRecord)
+        assert record.model_dump()["region"] == "eu"
+        assert record.extras == {"extra_field": "x"}
+
+
+    def test_nexsys_record_from_trusted_runs_subclass_validators(self):
+        """Test from_trusted validates a subclass that adds its own validators."""
+        class CheckedRecord(NexsysRecord):
+            @field_validator('amount')
+            @classmethod
+            def non_negative(cls, v):
+                if v is not None and v < 0:
+                    raise ValueError('amount must be non-negative')
+                return v
+
+        with pytest.raises(ValidationError):
+            CheckedRecord.from_trusted({"id": 1, "amount": -5.0})
+
+    def test_nexsys_record_from_trusted_merges_extras(self):
+        """Test a passed extras dict is merged with undeclared columns as validation does."""
+        data = {"id": 1, "extras": {"source": "feed"}, "extra_field": "x"}
+
+        trusted = NexsysRecord.from_trusted(data)
+
+        assert trusted.extras == {"source": "feed", "extra_field": "x"}
+        assert trusted == NexsysRecord.model_validate(data)
+        assert NexsysRecord.from_trusted({"id": 1, "extras": {"source": "feed"}}).extras == {"source": "feed"}
+
 
 class TestSalesRecord:
     """Test cases for SalesRecord model."""
@@ -388,8 +506,25 @@ class TestSalesRecord:
             transaction_date=datetime.now()
         )
 
-        # total_amount should be auto-calculated
-        assert record.total_amount == 31.50
+        # total should be auto-calculated
+        assert record.total_amount is None
+        assert record.total == 31.50
+
+    def test_sales_record_total_follows_updates(self):
+        """Test total reflects quantity changes made after it was first read."""
+        record = SalesRecord(
+            transaction_id="TXN123",
+            quantity=3,
+            unit_price=2.0,
+            transaction_date=datetime.now()
+        )
+        assert record.total == 6.0
+
+        updated = record.model_copy(update={"quantity": 5})
+        record.quantity = 4
+
+        assert updated.total == 10.0
+        assert record.total == 8.0
 
     def test_sales_record_negative_quantity_validation(self):
         """Test SalesRecord quantity validation."""
@@ -427,6 +562,7 @@ class TestSalesRecord:
 
         # Should use provided value, not calculate
         assert record.total_amount == 25.0
+        assert record.total == 25.0
 
 
 class TestGenericRecord:
@@ -439,6 +575,31 @@ class TestGenericRecord:
 
         assert record.data == data
 
+    def test_generic_record_pool_reuses_released_instances(self):
+        """Test that released GenericRecords are handed out again with new data."""
+        first = acquire_generic_record({"name": "first"})
+        release_records([first, TableInfo(database="db", table_name="t")])
+
+        second = acquire_generic_record({"name": "second"})
+
+        assert second is first
+        assert second["name"] == "second"
+
+    def test_generic_record_pool_ignores_double_release(self, monkeypatch):
+        """Test a record released twice is only handed out once."""
+        monkeypatch.setattr("dbxsql.models._GENERIC_RECORD_POOL", [])
+        monkeypatch.setattr("dbxsql.models._POOLED_RECORD_IDS", set())
+        record = GenericRecord(data={"name": "released"})
+        release_records([record])
+        release_records([record, record])
+
+        first = acquire_generic_record({"name": "first"})
+        second = acquire_generic_record({"name": "second"})
+
+        assert first is record
+        assert second is not first
+        assert first["name"] == "first"
+
     def test_generic_record_dict_access(self):
         """Test GenericRecord dict-like access methods."""
         data = {"name": "test", "value": 123}
@@ -544,4 +705,30 @@ class TestModelRegistry:
         assert MODEL_REGISTRY["sales"] == SalesRecord
         assert MODEL_REGISTRY["file_info"] == FileInfo
         assert MODEL_REGISTRY["table_info"] == TableInfo
-        assert MODEL_REGISTRY["generic"] == GenericRecord
\ No newline at end of file
+        assert MODEL_REGISTRY["generic"] == GenericRecord
+
+    def test_build_tagged_records_dispatches_on_tag(self):
+        """Test a mixed batch is validated into the model named by each row's tag."""
+        rows = [
+            {RECORD_TAG_KEY: "nexsys", "id": 1, "status": "active"},
+            {RECORD_TAG_KEY: "sales", "transaction_id": "TXN1", "quantity": 2,
+             "unit_price": 1.5, "transaction_date": datetime(2023, 1, 1)},
+            {"data": {"key": "value"}},
+        ]
+
+        records = build_tagged_records(rows)
+
+        assert [type(record) for record in records] == [NexsysRecord, SalesRecord, GenericRecord]
+        assert records[0].status == "active"
+        assert records[2]["key"] == "value"
+        assert records[0].extras == {}
+
+    def test_build_tagged_records_wraps_flat_generic_rows(self):
+        """Test a flat row tagged generic becomes GenericRecord data without the tag."""
+        row = {RECORD_TAG_KEY: "generic", "key": "value", "count": 3}
+
+        records = build_tagged_records([row])
+
+        assert type(records[0]) is GenericRecord
+        assert records[0].data == {"key": "value", "count": 3}
+        assert RECORD_TAG_KEY in row
@@ -1,16 +1,20 @@
 """Tests for query handler module."""
 
 import pytest
+from contextlib import nullcontext
 from unittest.mock import Mock, patch, MagicMock
 from databricks import sql
+from pydantic import field_validator
+import sys
+import threading
 import time
 
 from dbxsql.query_handler import (
-    QueryHandler, PydanticResultParser, QueryExecutor, RetryPolicy,
-    ResultParser
+    QueryHandler, PydanticResultParser, MsgspecResultParser, ArrowResultParser, QueryExecutor, RetryPolicy,
+    ResultParser, struct_for_model
 )
 from dbxsql.settings import DatabricksSettings
-from dbxsql.connection import ConnectionManagerInterface
+from dbxsql.connection import ConnectionManagerInterface, PooledConnectionManager
 from dbxsql.models import (
     QueryResult, QueryStatus, QueryMetrics, GenericRecord,
     FileInfo, TableInfo, NexsysRecord
@@ -19,6 +23,12 @@ from dbxsql.exceptions import (
     QueryExecutionError, SyntaxError, TimeoutError, DataParsingError
 )
 
+# Attribute lists computed once so Mock(spec=...) skips dir() on every construction
+_CONNECTION_MANAGER_SPEC = dir(ConnectionManagerInterface)
+# Pydantic fields are not class attributes, so add them to the spec explicitly
+_SETTINGS_SPEC = dir(DatabricksSettings) + list(DatabricksSettings.model_fields)
+_RESULT_PARSER_SPEC = dir(ResultParser)
+
 
 class TestPydanticResultParser:
     """Test cases for PydanticResultParser."""
@@ -76,6 +86,25 @@ class TestPydanticResultParser:
         assert len(result) == 1
         assert isinstance(result[0], GenericRecord)
 
+    def test_parse_results_subclass_validators_run(self):
+        """Test a NexsysRecord subclass's validators run rather than taking the trusted path."""
+        class CheckedRecord(NexsysRecord):
+            @field_validator('status')
+            @classmethod
+            def known_status(cls, v):
+                if v not in (None, 'active', 'inactive'):
+                    raise ValueError('unknown status')
+                return v
+
+        cursor = Mock()
+        cursor.description = [('id', 'int'), ('status', 'string')]
+        parser = PydanticResultParser(CheckedRecord)
+
+        result = parser.parse_results([(1, 'active'), (2, 'bogus')], cursor)
+
+        assert isinstance(result[0], CheckedRecord)
+        assert isinstance(result[1], GenericRecord)
+
     def test_parse_results_no_cursor_description(self):
         """Test parsing when cursor has no description."""
         mock_cursor = Mock()
@@ -116,19 +145,55 @@ class TestPydanticResultParser:
             assert "Failed to parse query results" in str(exc_info.value)
 
 
+class TestMsgspecResultParser:
+    """Test cases for MsgspecResultParser."""
+
+    @pytest.fixture
+    def mock_cursor(self):
+        """Mock cursor fixture."""
+        cursor = Mock()
+        cursor.description = [('database', 'string'), ('table_name', 'string')]
+        return cursor
+
+    def test_missing_msgspec_raises_import_error(self, monkeypatch):
+        """Test that the backend reports how to install msgspec."""
+        monkeypatch.setitem(sys.modules, 'msgspec', None)
+
+        with pytest.raises(ImportError, match="dbxsql\\[msgspec\\]"):
+            MsgspecResultParser(object)
+
+    def test_parse_results_into_struct_for_model(self, mock_cursor):
+        """Test converting rows into a Struct mirroring a Pydantic model."""
+        pytest.importorskip("msgspec")
+        parser = MsgspecResultParser(struct_for_model(TableInfo))
+
+        result = parser.parse_results([('db1', 't1'), ('db2', 't2')], mock_cursor)
+
+        assert [row.table_name for row in result] == ['t1', 't2']
+        assert result[0].is_temporary is False
+
+    def test_parse_results_invalid_row(self, mock_cursor):
+        """Test that conversion errors surface as DataParsingError."""
+        pytest.importorskip("msgspec")
+        parser = MsgspecResultParser(struct_for_model(TableInfo))
+
+        with pytest.raises(DataParsingError):
+            parser.parse_results([('db1', 42)], mock_cursor)
+
+
 class TestQueryExecutor:
     """Test cases for QueryExecutor."""
 
     @pytest.fixture
     def mock_connection_manager(self):
         """Mock connection manager fixture."""
-        manager = Mock(spec=ConnectionManagerInterface)
+        manager = Mock(spec=_CONNECTION_MANAGER_SPEC)
         return manager
 
     @pytest.fixture
     def mock_settings(self):
         """Mock settings fixture."""
-        settings = Mock(spec=DatabricksSettings)
+        settings = Mock(spec=_SETTINGS_SPEC)
         return settings
 
     @pytest.fixture
@@ -161,7 +226,7 @@ class TestQueryExecutor:
         mock_connection_manager.get_connection_context.return_value.__enter__.return_value = mock_cursor
         mock_connection_manager.get_connection_context.return_value.__exit__.return_value = None
 
-        mock_parser = Mock(spec=ResultParser)
+        mock_parser = Mock(spec=_RESULT_PARSER_SPEC)
         mock_parser.parse_results.return_value = [GenericRecord(data={'column1': 'test_value'})]
 
         result = query_executor.execute_query("SELECT 1", mock_parser)
@@ -238,6 +303,38 @@ class TestQueryExecutor:
         assert result.row_count == 0
         mock_cursor.fetchall.assert_not_called()
 
+    def test_execute_query_in_batches(self, query_executor, mock_connection_manager, mock_cursor):
+        """Test query execution fetching and parsing rows in batches."""
+        mock_connection_manager.get_connection_context.return_value = nullcontext(mock_cursor)
+        mock_cursor.fetchmany.side_effect = [[('a',), ('b',)], [('c',)], []]
+
+        parser = PydanticResultParser(GenericRecord)
+        result = query_executor.execute_query("SELECT 1", parser, batch_size=2)
+
+        assert result.status == QueryStatus.SUCCESS
+        assert result.row_count == 3
+        assert result.raw_data == [('a',), ('b',), ('c',)]
+        assert [record['column1'] for record in result.data] == ['a', 'b', 'c']
+        assert result.execution_time_seconds == result.execution_time_ns / 1e9
+        mock_cursor.fetchmany.assert_called_with(2)
+        mock_cursor.fetchall.assert_not_called()
+
+    def test_execute_query_arrow(self, query_executor, mock_connection_manager, mock_cursor):
+        """Test that an ArrowResultParser fetches a columnar table instead of tuples."""
+        mock_connection_manager.get_connection_context.return_value = nullcontext(mock_cursor)
+        table = Mock()
+        table.select.return_value.num_rows = 3
+        mock_cursor.fetchall_arrow.return_value = table
+
+        result = query_executor.execute_query("SELECT 1", ArrowResultParser(['column1']))
+
+        assert result.status == QueryStatus.SUCCESS
+        assert result.row_count == 3
+        assert result.arrow_table is table.select.return_value
+        assert result.data is None
+        table.select.assert_called_once_with(['column1'])
+        mock_cursor.fetchall.assert_not_called()
+
 
 class TestRetryPolicy:
     """Test cases for RetryPolicy."""
@@ -294,6 +391,17 @@ class TestRetryPolicy:
         actual_calls = [call[0][0] for call in mock_sleep.call_args_list]
         assert actual_calls == expected_calls
 
+    @patch('time.sleep')
+    @patch('random.uniform', return_value=0.25)
+    def test_retry_jitter_added_to_backoff(self, mock_uniform, mock_sleep):
+        """Test jitter is added on top of the backoff delay."""
+        policy = RetryPolicy(max_retries=1, base_delay=1.0, jitter=0.5)
+        mock_operation = Mock(side_effect=[QueryExecutionError("error"), "success"])
+
+        assert policy.execute_with_retry(mock_operation) == "success"
+        mock_uniform.assert_called_once_with(0, 0.5)
+        mock_sleep.assert_called_once_with(1.25)
+
     def test_syntax_error_no_retry(self):
         """Test that syntax errors are not retried."""
         policy = RetryPolicy(max_retries=3)
@@ -304,6 +412,16 @@ class TestRetryPolicy:
 
         mock_operation.assert_called_once()
 
+    def test_custom_non_retryable_error(self):
+        """Test errors passed as non_retryable are raised without retrying."""
+        policy = RetryPolicy(max_retries=3, non_retryable=(TimeoutError,))
+        mock_operation = Mock(side_effect=TimeoutError("timed out"))
+
+        with pytest.raises(TimeoutError):
+            policy.execute_with_retry(mock_operation)
+
+        mock_operation.assert_called_once()
+
     @patch('time.sleep')
     def test_max_retries_exceeded(self, mock_sleep):
         """Test behavior when max retries is exceeded."""
@@ -346,14 +464,16 @@ class TestQueryHandler:
     @pytest.fixture
     def mock_settings(self):
         """Mock settings fixture."""
-        settings = Mock(spec=DatabricksSettings)
+        settings = Mock(spec=_SETTINGS_SPEC)
         settings.max_retries = 3
+        settings.parser_backend = "pydantic"
+        settings.enable_result_pool = False
         return settings
 
     @pytest.fixture
     def mock_connection_manager(self):
         """Mock connection manager fixture."""
-        manager = Mock(spec=ConnectionManagerInterface)
+        manager = Mock(spec=_CONNECTION_MANAGER_SPEC)
         return manager
 
     @pytest.fixture
@@ -467,6 +587,62 @@ class TestQueryHandler:
             assert results[1].status == QueryStatus.FAILED
             assert "Query failed" in results[1].error_message
 
+    def test_execute_multiple_queries_parallel_with_pool(self, mock_settings):
+        """Test execute_multiple_queries runs queries concurrently on a pooled connection manager."""
+        mock_settings.max_parallel_queries = 2
+        handler = QueryHandler(mock_settings, Mock(spec=PooledConnectionManager))
+        # Both queries must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def run_query(query, model_class):
+            barrier.wait()
+            return QueryResult(status=QueryStatus.SUCCESS, query=query)
+
+        with patch.object(handler, 'execute_query_with_retry', side_effect=run_query):
+            results = handler.execute_multiple_queries(["SELECT 1", "SELECT 2"])
+
+        assert [results[i].query for i in range(2)] == ["SELECT 1", "SELECT 2"]
+
+    def test_execute_multiple_queries_parallel_closes_every_connection(self):
+        """Test a parallel batch on a real pooled manager closes every connection it opened."""
+        settings = DatabricksSettings(
+            client_id="test", client_secret="test", server_hostname="test.databricks.com",
+            http_path="/test", pool_max_size=4, max_parallel_queries=4
+        )
+        auth_manager = Mock()
+        auth_manager.get_access_token.return_value = "token"
+        opened = []
+
+        def open_connection(**kwargs):
+            connection = Mock()
+            connection.cursor.return_value.fetchall.return_value = [(1,)]
+            opened.append(connection)
+            return connection
+
+        with patch('dbxsql.connection.sql.connect', side_effect=open_connection):
+            handler = QueryHandler(settings, PooledConnectionManager(settings, auth_manager))
+            results = handler.execute_multiple_queries(["SELECT 1"] * 8)
+            handler.disconnect()
+
+        assert all(result.status == QueryStatus.SUCCESS for result in results.values())
+        assert 1 <= len(opened) <= 4
+        assert all(connection.close.call_count == 1 for connection in opened)
+
+    def test_session_reuses_one_cursor(self, query_handler, mock_connection_manager):
+        """Test that queries in a session share one connection context and cursor."""
+        cursor = Mock()
+        cursor.fetchall.return_value = [('value',)]
+        mock_connection_manager.get_connection_context.return_value = nullcontext(cursor)
+
+        with query_handler.session() as session:
+            first = session.execute_query("SELECT 1")
+            second = session.execute_query("SELECT 2")
+
+        assert first.status == second.status == QueryStatus.SUCCESS
+        assert cursor.execute.call_count == 2
+        mock_connection_manager.get_connection_context.assert_called_once()
+        assert query_handler.metrics.total_queries == 2
+
     def test_list_files(self, query_handler):
         """Test list_files convenience method."""
         with patch.object(query_handler, 'execute_query') as mock_execute:
@@ -537,11 +713,13 @@ class TestQueryHandler:
         # Add some metrics
         query_handler.metrics.total_queries = 5
         query_handler.metrics.successful_queries = 3
+        metrics = query_handler.metrics
 
         query_handler.reset_metrics()
 
         assert query_handler.metrics.total_queries == 0
         assert query_handler.metrics.successful_queries == 0
+        assert query_handler.metrics is metrics
 
     def test_test_connection(self, query_handler, mock_connection_manager):
         """Test test_connection method."""
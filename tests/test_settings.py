@@ -1,14 +1,44 @@
 """Tests for settings module."""
 
 import pytest
-from unittest.mock import patch, mock_open
+import logging
+import re
 from pydantic import ValidationError
-import os
-import tempfile
-from pathlib import Path
+from pydantic_settings.sources import DotEnvSettingsSource
 
 from dbxsql.settings import DatabricksSettings
 
+# Valid required fields shared by tests that only vary one setting
+BASE_KWARGS = {
+    "client_id": "test",
+    "client_secret": "test",
+    "server_hostname": "test.com",
+    "http_path": "/test",
+}
+BASE_KWARGS_DATABRICKS = {**BASE_KWARGS, "server_hostname": "test.databricks.com"}
+
+# Validation messages, compiled once and shared by the parametrized cases
+_LOG_LEVEL_RE = re.compile(r"Log level must be one of")
+_RETRIES_RE = re.compile(r"max_retries must be between 0 and 10")
+_PARSER_BACKEND_RE = re.compile(r"Parser backend must be one of")
+_TIMEOUT_RE = re.compile(r"Timeout must be greater than 0")
+_HOSTNAME_RE = re.compile(r"Invalid server hostname")
+_HTTP_PATH_RE = re.compile(r"HTTP path must start with /")
+_POOL_SIZE_RE = re.compile(r"pool_min_size must not exceed pool_max_size")
+_MISSING_FIELDS_RE = re.compile(r"client_id.*client_secret.*server_hostname.*http_path", re.DOTALL)
+
+
+def _clear_databricks_env(monkeypatch):
+    """Unset DATABRICKS_* variables so only the values under test reach the settings."""
+    for name in ("CLIENT_ID", "CLIENT_SECRET", "SERVER_HOSTNAME", "HTTP_PATH", "LOG_LEVEL"):
+        monkeypatch.delenv(f"DATABRICKS_{name}", raising=False)
+
+
+@pytest.fixture(scope="module")
+def valid_settings():
+    """Settings built once for the read-only tests; copy before changing a field."""
+    return DatabricksSettings(**BASE_KWARGS_DATABRICKS)
+
 
 class TestDatabricksSettings:
     """Test cases for DatabricksSettings."""
@@ -22,14 +52,17 @@ class TestDatabricksSettings:
             http_path="/sql/1.0/warehouses/test"
         )
 
-        assert settings.client_id == "test_client_id"
-        assert settings.client_secret == "test_client_secret"
-        assert settings.server_hostname == "test.databricks.com"
-        assert settings.http_path == "/sql/1.0/warehouses/test"
-        assert settings.log_level == "INFO"  # default value
-        assert settings.max_retries == 3  # default value
+        expected = {
+            "client_id": "test_client_id",
+            "client_secret": "test_client_secret",
+            "server_hostname": "test.databricks.com",
+            "http_path": "/sql/1.0/warehouses/test",
+            "log_level": "INFO",  # default value
+            "max_retries": 3,  # default value
+        }
+        assert settings.model_dump(include=expected.keys()) == expected
 
-    def test_settings_with_env_variables(self):
+    def test_settings_with_env_variables(self, monkeypatch):
         """Test settings loading from environment variables."""
         env_vars = {
             "DATABRICKS_CLIENT_ID": "env_client_id",
@@ -40,17 +73,22 @@ class TestDatabricksSettings:
             "DATABRICKS_MAX_RETRIES": "5"
         }
 
-        with patch.dict(os.environ, env_vars):
-            settings = DatabricksSettings()
+        for name, value in env_vars.items():
+            monkeypatch.setenv(name, value)
 
-            assert settings.client_id == "env_client_id"
-            assert settings.client_secret == "env_client_secret"
-            assert settings.server_hostname == "env.databricks.com"
-            assert settings.http_path == "/sql/1.0/warehouses/env"
-            assert settings.log_level == "DEBUG"
-            assert settings.max_retries == 5
+        settings = DatabricksSettings()
 
-    def test_case_insensitive_env_variables(self):
+        expected = {
+            "client_id": "env_client_id",
+            "client_secret": "env_client_secret",
+            "server_hostname": "env.databricks.com",
+            "http_path": "/sql/1.0/warehouses/env",
+            "log_level": "DEBUG",
+            "max_retries": 5,
+        }
+        assert settings.model_dump(include=expected.keys()) == expected
+
+    def test_case_insensitive_env_variables(self, monkeypatch):
         """Test that environment variables are case insensitive."""
         env_vars = {
             "databricks_client_id": "case_insensitive_id",
@@ -59,201 +97,93 @@ class TestDatabricksSettings:
             "DATABRICKS_http_path": "/sql/1.0/warehouses/case"
         }
 
-        with patch.dict(os.environ, env_vars):
-            settings = DatabricksSettings()
+        for name, value in env_vars.items():
+            monkeypatch.setenv(name, value)
+
+        settings = DatabricksSettings()
 
-            assert settings.client_id == "case_insensitive_id"
-            assert settings.client_secret == "case_insensitive_secret"
-            assert settings.server_hostname == "case.databricks.com"
-            assert settings.http_path == "/sql/1.0/warehouses/case"
+        assert settings.client_id == "case_insensitive_id"
+        assert settings.client_secret == "case_insensitive_secret"
+        assert settings.server_hostname == "case.databricks.com"
+        assert settings.http_path == "/sql/1.0/warehouses/case"
 
-    def test_env_file_loading(self):
+    def test_env_file_loading(self, monkeypatch):
         """Test loading settings from .env file."""
-        env_content = """
-DATABRICKS_CLIENT_ID=file_client_id
-DATABRICKS_CLIENT_SECRET=file_client_secret
-DATABRICKS_SERVER_HOSTNAME=file.databricks.com
-DATABRICKS_HTTP_PATH=/sql/1.0/warehouses/file
-DATABRICKS_LOG_LEVEL=WARNING
-"""
-
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.env', delete=False) as f:
-            f.write(env_content)
-            env_file_path = f.name
-
-        try:
-            # Patch the env_file path in the model config
-            with patch.object(DatabricksSettings.model_config, 'env_file', env_file_path):
-                settings = DatabricksSettings()
-
-                assert settings.client_id == "file_client_id"
-                assert settings.client_secret == "file_client_secret"
-                assert settings.server_hostname == "file.databricks.com"
-                assert settings.http_path == "/sql/1.0/warehouses/file"
-                assert settings.log_level == "WARNING"
-        finally:
-            os.unlink(env_file_path)
-
-    def test_invalid_log_level_validation(self):
-        """Test validation of invalid log level."""
-        with pytest.raises(ValidationError) as exc_info:
-            DatabricksSettings(
-                client_id="test",
-                client_secret="test",
-                server_hostname="test.com",
-                http_path="/test",
-                log_level="INVALID"
-            )
-
-        assert "Log level must be one of" in str(exc_info.value)
-
-    def test_invalid_max_retries_validation(self):
-        """Test validation of invalid max_retries."""
-        with pytest.raises(ValidationError) as exc_info:
-            DatabricksSettings(
-                client_id="test",
-                client_secret="test",
-                server_hostname="test.com",
-                http_path="/test",
-                max_retries=-1
-            )
-
-        assert "max_retries must be between 0 and 10" in str(exc_info.value)
-
-        with pytest.raises(ValidationError) as exc_info:
-            DatabricksSettings(
-                client_id="test",
-                client_secret="test",
-                server_hostname="test.com",
-                http_path="/test",
-                max_retries=15
-            )
-
-        assert "max_retries must be between 0 and 10" in str(exc_info.value)
-
-    def test_invalid_timeout_validation(self):
-        """Test validation of invalid timeout values."""
-        with pytest.raises(ValidationError) as exc_info:
-            DatabricksSettings(
-                client_id="test",
-                client_secret="test",
-                server_hostname="test.com",
-                http_path="/test",
-                query_timeout=0
-            )
-
-        assert "Timeout must be greater than 0" in str(exc_info.value)
-
-        with pytest.raises(ValidationError) as exc_info:
-            DatabricksSettings(
-                client_id="test",
-                client_secret="test",
-                server_hostname="test.com",
-                http_path="/test",
-                connection_timeout=-5
-            )
-
-        assert "Timeout must be greater than 0" in str(exc_info.value)
-
-    def test_invalid_hostname_validation(self):
-        """Test validation of invalid hostname."""
-        with pytest.raises(ValidationError) as exc_info:
-            DatabricksSettings(
-                client_id="test",
-                client_secret="test",
-                server_hostname="invalid_hostname",  # no dot
-                http_path="/test"
-            )
-
-        assert "Invalid server hostname" in str(exc_info.value)
-
-        with pytest.raises(ValidationError) as exc_info:
-            DatabricksSettings(
-                client_id="test",
-                client_secret="test",
-                server_hostname="",  # empty
-                http_path="/test"
-            )
-
-        assert "Invalid server hostname" in str(exc_info.value)
-
-    def test_invalid_http_path_validation(self):
-        """Test validation of invalid HTTP path."""
-        with pytest.raises(ValidationError) as exc_info:
-            DatabricksSettings(
-                client_id="test",
-                client_secret="test",
-                server_hostname="test.com",
-                http_path="invalid_path"  # doesn't start with /
-            )
-
-        assert "HTTP path must start with /" in str(exc_info.value)
-
-    def test_get_token_url(self):
+        # Serve parsed env file contents directly; reading and tokenising the file is python-dotenv's job
+        env_file_values = {
+            "databricks_client_id": "file_client_id",
+            "databricks_client_secret": "file_client_secret",
+            "databricks_server_hostname": "file.databricks.com",
+            "databricks_http_path": "/sql/1.0/warehouses/file",
+            "databricks_log_level": "WARNING",
+        }
+        # Real environment variables take precedence over the env file
+        _clear_databricks_env(monkeypatch)
+        monkeypatch.setattr(DotEnvSettingsSource, "_read_env_files", lambda self: env_file_values)
+
+        settings = DatabricksSettings()
+
+        assert settings.client_id == "file_client_id"
+        assert settings.client_secret == "file_client_secret"
+        assert settings.server_hostname == "file.databricks.com"
+        assert settings.http_path == "/sql/1.0/warehouses/file"
+        assert settings.log_level == "WARNING"
+
+    @pytest.mark.parametrize("overrides,match", [
+        pytest.param({"log_level": "INVALID"}, _LOG_LEVEL_RE, id="log_level_INVALID"),
+        pytest.param({"max_retries": -1}, _RETRIES_RE, id="max_retries_-1"),
+        pytest.param({"max_retries": 15}, _RETRIES_RE, id="max_retries_15"),
+        pytest.param({"parser_backend": "orjson"}, _PARSER_BACKEND_RE, id="parser_backend_orjson"),
+        pytest.param({"query_timeout": 0}, _TIMEOUT_RE, id="query_timeout_0"),
+        pytest.param({"connection_timeout": -5}, _TIMEOUT_RE, id="connection_timeout_-5"),
+        pytest.param({"server_hostname": "invalid_hostname"}, _HOSTNAME_RE, id="server_hostname_no_dot"),
+        pytest.param({"server_hostname": ""}, _HOSTNAME_RE, id="server_hostname_empty"),
+        pytest.param({"http_path": "invalid_path"}, _HTTP_PATH_RE, id="http_path_no_slash"),
+        pytest.param({"pool_min_size": 6, "pool_max_size": 5}, _POOL_SIZE_RE, id="pool_min_size_above_max"),
+    ])
+    def test_field_validation(self, overrides, match):
+        """Test validation of invalid field values."""
+        with pytest.raises(ValidationError, match=match):
+            DatabricksSettings(**BASE_KWARGS | overrides)
+
+    def test_get_token_url(self, valid_settings):
         """Test token URL generation."""
-        settings = DatabricksSettings(
-            client_id="test",
-            client_secret="test",
-            server_hostname="test.databricks.com",
-            http_path="/test"
-        )
-
         expected_url = "https://test.databricks.com/oidc/v1/token"
-        assert settings.get_token_url() == expected_url
+        assert valid_settings.get_token_url() == expected_url
 
-    def test_configure_logging(self):
+    def test_configure_logging(self, valid_settings, monkeypatch):
         """Test logging configuration."""
-        settings = DatabricksSettings(
-            client_id="test",
-            client_secret="test",
-            server_hostname="test.com",
-            http_path="/test",
-            log_level="DEBUG"
-        )
+        # Record basicConfig calls instead of installing handlers on the real root logger
+        calls = []
+        monkeypatch.setattr(logging, "basicConfig", lambda **kwargs: calls.append(kwargs))
 
-        # Test that configure_logging doesn't raise an exception
-        settings.configure_logging()
+        valid_settings.model_copy(update={"log_level": "DEBUG"}).configure_logging()
+        valid_settings.model_copy(update={"log_level": "ERROR"}).configure_logging()
 
-        # Test with different log level
-        settings.log_level = "ERROR"
-        settings.configure_logging()
+        assert [call["level"] for call in calls] == [logging.DEBUG, logging.ERROR]
 
-    def test_defaults_applied(self):
+    def test_defaults_applied(self, valid_settings):
         """Test that default values are properly applied."""
-        settings = DatabricksSettings(
-            client_id="test",
-            client_secret="test",
-            server_hostname="test.com",
-            http_path="/test"
-        )
-
-        assert settings.log_level == "INFO"
-        assert settings.max_retries == 3
-        assert settings.query_timeout == 300
-        assert settings.connection_timeout == 30
-        assert settings.oauth_scope == "all-apis"
+        expected = {
+            "log_level": "INFO",
+            "max_retries": 3,
+            "query_timeout": 300,
+            "connection_timeout": 30,
+            "oauth_scope": "all-apis",
+        }
+        assert valid_settings.model_dump(include=expected.keys()) == expected
 
-    def test_missing_required_fields(self):
+    def test_missing_required_fields(self, monkeypatch):
         """Test that missing required fields raise validation errors."""
-        with pytest.raises(ValidationError) as exc_info:
-            DatabricksSettings()
+        _clear_databricks_env(monkeypatch)
 
-        error_str = str(exc_info.value)
-        assert "client_id" in error_str
-        assert "client_secret" in error_str
-        assert "server_hostname" in error_str
-        assert "http_path" in error_str
+        with pytest.raises(ValidationError, match=_MISSING_FIELDS_RE):
+            DatabricksSettings()
 
     def test_extra_fields_ignored(self):
         """Test that extra fields are ignored due to extra='ignore'."""
         # This should not raise an error even with extra fields
-        settings = DatabricksSettings(
-            client_id="test",
-            client_secret="test",
-            server_hostname="test.com",
-            http_path="/test",
-            extra_field="should_be_ignored"
-        )
+        settings = DatabricksSettings(**BASE_KWARGS, extra_field="should_be_ignored")
 
         assert settings.client_id == "test"
         assert not hasattr(settings, 'extra_field')
\ No newline at end of file